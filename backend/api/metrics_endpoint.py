@@ -6,7 +6,7 @@ Provides Prometheus-compatible metrics and performance monitoring
 import logging
 import time
 from collections import defaultdict, deque
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from api.dependencies import setup_request_context
 from core.config import settings
@@ -28,16 +28,24 @@ performance_data: Dict[str, Any] = {
     "start_time": time.time(),
     "requests_total": 0,
     "errors_total": 0,
+    "duration_ms_total": 0.0,
     "cache_hits": 0,
     "cache_misses": 0,
 }
 
+# Seconds a rendered Prometheus exposition is reused between scrapes
+_PROMETHEUS_TTL = 1.0
+
+# (monotonic time rendered, exposition) of the last Prometheus render
+_prometheus_cache: Optional[Tuple[float, str]] = None
+
 metrics_router = APIRouter(prefix="/metrics", tags=["monitoring"])
 
 
 def record_request_metric(duration_ms: float, status_code: int, endpoint: str = "unknown") -> None:
     """Record request metrics for monitoring"""
     performance_data["requests_total"] += 1
+    performance_data["duration_ms_total"] += duration_ms
 
     # Track by endpoint
     request_metrics["request_count"][endpoint] += 1
@@ -69,6 +77,16 @@ async def prometheus_metrics(_: str = Depends(setup_request_context)) -> str:
     Prometheus-compatible metrics endpoint
     Returns metrics in Prometheus text format
     """
+    return await render_prometheus_metrics()
+
+
+async def render_prometheus_metrics() -> str:
+    """Render the Prometheus exposition, reusing it for scrapes within _PROMETHEUS_TTL"""
+    global _prometheus_cache
+
+    now = time.monotonic()
+    if _prometheus_cache is not None and now - _prometheus_cache[0] < _PROMETHEUS_TTL:
+        return _prometheus_cache[1]
 
     cache = get_cache()
     cache_stats = await cache.get_stats()
@@ -83,6 +101,11 @@ async def prometheus_metrics(_: str = Depends(setup_request_context)) -> str:
         if performance_data["requests_total"] > 0
         else 0
     )
+    avg_response_ms = (
+        performance_data["duration_ms_total"] / performance_data["requests_total"]
+        if performance_data["requests_total"] > 0
+        else 0
+    )
     cache_hit_rate = (
         performance_data["cache_hits"]
         / (performance_data["cache_hits"] + performance_data["cache_misses"])
@@ -108,6 +131,10 @@ async def prometheus_metrics(_: str = Depends(setup_request_context)) -> str:
         "# TYPE clipforge_error_rate gauge",
         f"clipforge_error_rate {error_rate:.4f}",
         "",
+        "# HELP clipforge_avg_response_ms Mean response time in milliseconds",
+        "# TYPE clipforge_avg_response_ms gauge",
+        f"clipforge_avg_response_ms {avg_response_ms:.2f}",
+        "",
         "# HELP clipforge_uptime_seconds Application uptime in seconds",
         "# TYPE clipforge_uptime_seconds gauge",
         f"clipforge_uptime_seconds {uptime:.0f}",
@@ -153,7 +180,9 @@ async def prometheus_metrics(_: str = Depends(setup_request_context)) -> str:
             ]
         )
 
-    return "\n".join(metrics_lines)
+    text = "\n".join(metrics_lines)
+    _prometheus_cache = (now, text)
+    return text
 
 
 @metrics_router.get("/health/detailed")
@@ -316,12 +345,13 @@ async def reset_metrics(_: str = Depends(setup_request_context)) -> Dict[str, st
     if not settings.debug:
         raise HTTPException(status_code=403, detail="Metrics reset only allowed in debug mode")
 
-    global performance_data, request_metrics
+    global performance_data, request_metrics, _prometheus_cache
 
     performance_data = {
         "start_time": time.time(),
         "requests_total": 0,
         "errors_total": 0,
+        "duration_ms_total": 0.0,
         "cache_hits": 0,
         "cache_misses": 0,
     }
@@ -332,6 +362,7 @@ async def reset_metrics(_: str = Depends(setup_request_context)) -> Dict[str, st
         "error_count": defaultdict(int),
         "status_codes": defaultdict(int),
     }
+    _prometheus_cache = None
 
     logger.info("Metrics reset by admin")
 
@@ -3,20 +3,21 @@ API v1 Router - Main router for all v1 API endpoints
 Combines all API routes with proper structure and documentation
 """
 
-from typing import Any, Dict
-
 from api.dependencies import check_service_health, get_metrics_summary, setup_request_context
-from api.metrics_endpoint import metrics_router
+from api.metrics_endpoint import metrics_router, render_prometheus_metrics
 from api.v1.auth import router as auth_router
 from api.v1.clips import router as clips_router
 from api.v1.sessions import router as sessions_router
 from api.v1.storage import router as storage_router
 from core.config import settings
 from core.logging import get_logger
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse, Response
 
 logger = get_logger("api_v1")
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 # Create the main v1 router
 v1_router = APIRouter(prefix="/api/v1")
 
@@ -28,9 +29,10 @@ v1_router.include_router(storage_router)
 v1_router.include_router(metrics_router)
 
 
-# Health check endpoint at the v1 level
-@v1_router.get("/health")
-async def health_check(_: str = Depends(setup_request_context)) -> Dict[str, Any]:
+# Health check endpoint at the v1 level. Probes hit it constantly, so serialize with orjson
+# and hand back the response directly, skipping FastAPI's jsonable_encoder pass.
+@v1_router.get("/health", response_class=ORJSONResponse)
+async def health_check(_: str = Depends(setup_request_context)) -> ORJSONResponse:
     """Comprehensive health check endpoint for v1 API"""
     try:
         logger.debug("Performing health check")
@@ -54,41 +56,52 @@ async def health_check(_: str = Depends(setup_request_context)) -> Dict[str, Any
         else:
             logger.debug("Health check passed")
 
-        return health_status
+        return ORJSONResponse(health_status)
 
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return {
-            "status": "unhealthy",
-            "service": settings.app_name,
-            "version": settings.app_version,
-            "api_version": "v1",
-            "error": str(e),
-        }
+        return ORJSONResponse(
+            {
+                "status": "unhealthy",
+                "service": settings.app_name,
+                "version": settings.app_version,
+                "api_version": "v1",
+                "error": str(e),
+            }
+        )
 
 
 # Alternative health endpoint path
-@v1_router.get("/api/health")
+@v1_router.get("/api/health", response_class=ORJSONResponse)
 async def alt_health_check(
     _: str = Depends(setup_request_context),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Alternative health check endpoint path"""
     return await health_check()
 
 
 # Metrics endpoint for monitoring
-@v1_router.get("/metrics")
+@v1_router.get("/metrics", response_class=ORJSONResponse)
 async def get_performance_metrics(
+    request: Request,
     _: str = Depends(setup_request_context),
-) -> Dict[str, Any]:
+) -> Response:
     """Get performance metrics for monitoring and alerting"""
+    # Prometheus scrapers ask for text (or OpenMetrics) and get the same cached exposition
+    # as /metrics/prometheus
+    accept = request.headers.get("accept", "")
+    if "text/plain" in accept or "openmetrics" in accept:
+        return Response(
+            content=await render_prometheus_metrics(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
+
     try:
         logger.debug("Retrieving performance metrics")
         metrics = await get_metrics_summary()
-        return metrics
+        return ORJSONResponse(metrics)
     except Exception as e:
         logger.error(f"Failed to retrieve metrics: {e}")
-        return {"error": "Failed to retrieve metrics", "timestamp": "unknown"}
+        return ORJSONResponse({"error": "Failed to retrieve metrics", "timestamp": "unknown"})
 
 
 # Export the router
@@ -16,9 +16,10 @@ from core.exceptions import ClipForgeException, FileAccessError, FileNotFoundErr
 from core.logging import get_logger
 from domain.schemas import PlexUser
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from infrastructure.database import get_db_session
 from infrastructure.repositories import ClipRepository, EditRepository
+from services.cache_service import get_thumbnail_cache
 from services.secure_storage_service import SecureStorageService
 
 logger = get_logger("storage_api")
@@ -391,7 +392,7 @@ async def secure_thumbnail_stream(
     token: Optional[str] = Query(None, description="Media access token"),
     _: str = Depends(setup_request_context),
     storage_service: SecureStorageService = Depends(get_storage_service),
-) -> FileResponse:
+) -> Response:
     """Securely stream thumbnail file with user ownership validation"""
     try:
         # Handle authentication - either through cookie or token
@@ -432,6 +433,15 @@ async def secure_thumbnail_stream(
                     detail="Clip not found or access denied",
                 )
 
+            # Serve straight from memory when this worker generated the thumbnail
+            cached_thumbnail = get_thumbnail_cache().get(clip_id)
+            if cached_thumbnail is not None:
+                return storage_service.stream_image_bytes(
+                    image_id=f"thumb_{clip_id}",
+                    user_id=authenticated_user.user_id,
+                    data=cached_thumbnail,
+                )
+
             # Construct thumbnail path
             from core.config import settings
 
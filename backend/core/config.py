@@ -108,6 +108,16 @@ class Settings(BaseSettings):
     # Performance Settings
     max_concurrent_clips: int = 5
     clip_processing_timeout: int = 300  # 5 minutes
+    hw_accel: str = "none"  # Hardware H.264 encoding: "none", "nvenc" or "vaapi"
+    hw_accel_device: str = "/dev/dri/renderD128"  # Render node used for VA-API
+    ffmpeg_pool_size: int = 0  # Threads for in-process frame decoding; 0 = 2 x CPU count
+    ffmpeg_threads_per_invocation: int = 0  # FFmpeg -threads per process; 0 = derive from load
+
+    # Health Monitoring
+    health_cache_ttl: float = 3.0  # Seconds a /health result is shared between callers
+    health_check_timeout: float = 3.0  # Seconds each /health sub-check may take
+    health_deep_storage_check: bool = False  # Probe writability by writing a temp file
+    metrics_refresh_s: float = 5.0  # Seconds between disk/CPU/memory samples for /health
 
     # User Limits
     user_video_limit: int = DEFAULT_USER_VIDEO_LIMIT
@@ -174,6 +184,24 @@ class Settings(BaseSettings):
         if self.clip_processing_timeout < 10:
             errors.append("CLIP_PROCESSING_TIMEOUT must be at least 10 seconds")
 
+        if self.ffmpeg_pool_size < 0:
+            errors.append("FFMPEG_POOL_SIZE must be non-negative")
+
+        if self.ffmpeg_threads_per_invocation < 0:
+            errors.append("FFMPEG_THREADS_PER_INVOCATION must be non-negative")
+
+        if self.health_cache_ttl < 0:
+            errors.append("HEALTH_CACHE_TTL must be non-negative")
+
+        if self.health_check_timeout <= 0:
+            errors.append("HEALTH_CHECK_TIMEOUT must be positive")
+
+        if self.metrics_refresh_s <= 0:
+            errors.append("METRICS_REFRESH_S must be positive")
+
+        if self.hw_accel not in ("none", "nvenc", "vaapi"):
+            errors.append("HW_ACCEL must be one of: none, nvenc, vaapi")
+
         # Validate user limits
         if self.user_video_limit < 1:
             errors.append("USER_VIDEO_LIMIT must be at least 1")
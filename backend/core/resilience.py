@@ -5,6 +5,7 @@ Provides decorators and classes for handling transient failures gracefully
 
 import asyncio
 import functools
+import inspect
 import secrets
 import time
 from datetime import datetime
@@ -298,8 +299,11 @@ async def retry_async(
         try:
             if asyncio.iscoroutinefunction(func):
                 return await func(*args, **kwargs)
-            else:
-                return func(*args, **kwargs)
+            result = func(*args, **kwargs)
+            # Callables such as `lambda: loop.run_in_executor(...)` return an awaitable
+            if inspect.isawaitable(result):
+                return await result
+            return result
         except Exception as e:
             last_exception = e
 
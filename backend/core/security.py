@@ -3,7 +3,6 @@ Security utilities for ClipForge
 Handles path validation, input sanitization, and security checks
 """
 
-import hashlib
 import hmac
 import re
 from pathlib import Path
@@ -19,13 +18,16 @@ class SecurityUtils:
     """Utility class for security-related operations"""
 
     @staticmethod
-    def validate_file_path(file_path: Union[str, Path], base_path: Union[str, Path]) -> Path:
+    def validate_file_path(
+        file_path: Union[str, Path], base_path: Union[str, Path], base_resolved: bool = False
+    ) -> Path:
         """
         Validate file path to prevent directory traversal attacks
 
         Args:
             file_path: The file path to validate
             base_path: The base directory that files must be within
+            base_resolved: base_path is already absolute and resolved, skip resolving it again
 
         Returns:
             Resolved Path object if valid
@@ -34,12 +36,14 @@ class SecurityUtils:
             ValueError: If path is invalid or outside base directory
         """
         try:
-            # Convert to Path objects and resolve
+            # Convert to Path objects and resolve; the file is always resolved so symlinks
+            # cannot point outside the base directory
             file_path = Path(file_path).resolve()
-            base_path = Path(base_path).resolve()
+            base_path = Path(base_path) if base_resolved else Path(base_path).resolve()
 
-            # Check if file path is within base directory
-            if not str(file_path).startswith(str(base_path)):
+            # Check if file path is within base directory (component-wise, so a sibling
+            # such as /data/clips-other does not pass for /data/clips)
+            if not file_path.is_relative_to(base_path):
                 raise ValueError(f"Access denied - path outside allowed directory: {file_path}")
 
             return file_path
@@ -97,7 +101,7 @@ class SecurityUtils:
             HMAC signature as hex string
         """
         message = f"{file_id}:{user_id}".encode("utf-8")
-        return hmac.new(secret_key.encode("utf-8"), message, hashlib.sha256).hexdigest()
+        return hmac.digest(secret_key.encode("utf-8"), message, "sha256").hex()
 
     @staticmethod
     def verify_file_signature(file_id: str, user_id: str, signature: str, secret_key: str) -> bool:
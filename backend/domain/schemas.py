@@ -8,7 +8,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 from core.security import InputValidator, SecurityUtils
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic.alias_generators import to_camel
 from typing_extensions import Self
 
 
@@ -95,6 +96,25 @@ class PlexServer(BaseModel):
         return f"{self.scheme}://{self.host}:{self.port}"
 
 
+class PlexStreamPart(BaseModel):
+    """Plex stream part model"""
+
+    id: str
+    key: Optional[str] = None
+    duration: Optional[int] = None
+    file: Optional[str] = None
+    frame_rate: Optional[float] = None
+
+
+class PlexStreamMedia(BaseModel):
+    """Plex stream media model"""
+
+    id: str
+    duration: Optional[int] = None
+    bitrate: Optional[int] = None
+    parts: List[PlexStreamPart] = []
+
+
 class MediaInfo(BaseModel):
     """Media information model"""
 
@@ -148,33 +168,40 @@ class MediaInfo(BaseModel):
     index: Optional[int] = None
 
     # Media streams containing file paths
-    media_streams: List["PlexStreamMedia"] = []
+    media_streams: List[PlexStreamMedia] = []
 
 
 class PlayerInfo(BaseModel):
-    """Player information model"""
+    """Player information model
 
-    machine_identifier: str
-    product: str
-    platform: str
-    platform_version: str
-    device: str
-    model: str
+    Validates straight from Plex's camelCase ``Player`` payload; serialisation keeps snake_case.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(validation_alias=to_camel), populate_by_name=True
+    )
+
+    machine_identifier: str = ""
+    product: str = ""
+    platform: str = ""
+    platform_version: str = ""
+    device: str = ""
+    model: str = ""
     vendor: Optional[str] = None
-    version: str
-    address: str
+    version: str = ""
+    address: str = ""
     port: Optional[int] = None
     protocol: Optional[str] = None
     protocol_version: Optional[str] = None
     protocol_capabilities: Optional[str] = None
-    title: str
+    title: str = ""
     device_class: Optional[str] = None
     profile: Optional[str] = None
     remote_public_address: Optional[str] = None
     local: Optional[bool] = None
     relay: Optional[bool] = None
     secure: Optional[bool] = None
-    user_id: Optional[int] = None
+    user_id: Optional[int] = Field(default=None, validation_alias="userID")
 
 
 class PlexSessionLocation(BaseModel):
@@ -233,24 +260,7 @@ class OriginalFileInfo(BaseModel):
     optimized_for_streaming: Optional[bool] = None
     width: Optional[int] = None
     height: Optional[int] = None
-
-
-class PlexStreamPart(BaseModel):
-    """Plex stream part model"""
-
-    id: str
-    key: Optional[str] = None
-    duration: Optional[int] = None
-    file: Optional[str] = None
-
-
-class PlexStreamMedia(BaseModel):
-    """Plex stream media model"""
-
-    id: str
-    duration: Optional[int] = None
-    bitrate: Optional[int] = None
-    parts: List["PlexStreamPart"] = []
+    frame_rate: Optional[float] = None
 
 
 # Auth Models
@@ -284,6 +294,8 @@ class SessionInfo(BaseModel):
     player: PlayerInfo
     session: PlexSessionInfo
     original_file_info: Optional[OriginalFileInfo] = None
+    # Server the session was found on, kept for file path resolution; never serialised
+    server_context: Optional[PlexServer] = Field(default=None, exclude=True)
 
 
 class CurrentSessionResponse(BaseModel):
@@ -5,6 +5,7 @@ Implements proper SQL injection protection and transaction management
 
 import logging
 import os
+import time
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Dict, Generator, Optional, Type
@@ -20,6 +21,7 @@ from sqlalchemy import (
     Text,
     create_engine,
     event,
+    inspect,
 )
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -29,7 +31,7 @@ from sqlalchemy.orm import (
     relationship,
     sessionmaker,
 )
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlalchemy.sql import text
 
 logger = logging.getLogger(__name__)
@@ -106,8 +108,40 @@ class DatabaseConfig:
     def create_tables(self) -> None:
         """Create all database tables"""
         Base.metadata.create_all(bind=self.engine)
+        self._add_missing_columns()
         logger.info("Database tables created/verified")
 
+    def _add_missing_columns(self) -> None:
+        """Add nullable columns that were introduced after a table was first created"""
+        # create_all only creates missing tables, it never alters existing ones
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                if not inspector.has_table(table.name):
+                    continue
+                existing = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing or not column.nullable:
+                        continue
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    # Identifiers come from the ORM metadata, not user input
+                    ddl = f"ALTER TABLE {table.name} ADD {column.name} {column_type}"  # nosec
+                    connection.execute(text(ddl))
+                    logger.info(f"Added column {table.name}.{column.name}")
+
+    def get_pool_status(self) -> Dict[str, Any]:
+        """Report the connection pool's current state"""
+        pool = self.engine.pool
+        if isinstance(pool, QueuePool):
+            return {
+                "pool_size": pool.size(),
+                "active_connections": pool.checkedout(),
+                "idle_connections": pool.checkedin(),
+                "overflow": pool.overflow(),
+            }
+        # SQLite shares one connection through StaticPool, which keeps no counts
+        return {"pool_class": type(pool).__name__, "status": pool.status()}
+
     def get_session(self) -> Session:
         """Get a new database session"""
         return self.SessionLocal()
@@ -158,6 +192,11 @@ class Clip(Base):
     episode_number: Mapped[Optional[int]] = mapped_column(Integer)
     original_timestamp: Mapped[Optional[str]] = mapped_column(String(50))
 
+    # Stream info recorded at creation so edits can decide on stream copy without probing
+    video_codec: Mapped[Optional[str]] = mapped_column(String(20))
+    audio_codec: Mapped[Optional[str]] = mapped_column(String(20))
+    container_format: Mapped[Optional[str]] = mapped_column(String(10))
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
@@ -391,6 +430,11 @@ def init_database() -> None:
         raise
 
 
+def get_pool_status() -> Dict[str, Any]:
+    """Get connection pool statistics for the shared engine"""
+    return db_config.get_pool_status()
+
+
 # Health check function
 def check_database_health() -> Dict[str, Any]:
     """
@@ -404,12 +448,15 @@ def check_database_health() -> Dict[str, Any]:
         "connection": False,
         "tables_exist": False,
         "error": None,
+        "query_ms": None,
     }
 
     try:
         with get_db_session() as session:
-            # Test basic connectivity
+            # Test basic connectivity, timing the round trip for performance reporting
+            query_start = time.monotonic()
             session.execute(text("SELECT 1"))
+            health_status["query_ms"] = (time.monotonic() - query_start) * 1000
             health_status["connection"] = True
 
             # Check if tables exist
@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from core.security import SecurityUtils
 from infrastructure.database import Clip, Edit, SecureQueryBuilder, Snapshot, User
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, desc, func, insert
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -227,6 +227,41 @@ class ClipRepository(BaseRepository):
             logger.error(f"Error updating clip {clip_id} for user {user_id}: {e}")
             return False
 
+    def update_status(
+        self,
+        clip_id: str,
+        user_id: str,
+        status: str,
+        file_size: Optional[int] = None,
+        error_message: Optional[str] = None,
+        stream_info: Optional[Tuple[Optional[str], Optional[str], str]] = None,
+    ) -> bool:
+        """
+        Update processing status (and final size) of a reserved clip
+
+        stream_info is the (video_codec, audio_codec, container_format) of the output file.
+        """
+        try:
+            clip = self.get_by_id(clip_id, user_id)
+            if not clip:
+                return False
+
+            clip.status = status
+            if file_size is not None:
+                clip.file_size = file_size
+            if error_message is not None:
+                clip.error_message = self._sanitize_string_input(error_message, 1000)
+            if stream_info is not None:
+                clip.video_codec, clip.audio_codec, clip.container_format = stream_info
+
+            self.session.flush()
+            logger.debug(f"Updated clip {clip_id} status to {status} for user {user_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating clip {clip_id} status for user {user_id}: {e}")
+            return False
+
     def delete_clip(self, clip_id: str, user_id: str) -> bool:
         """Delete clip with user validation and cleanup of all associated files"""
         try:
@@ -279,6 +314,25 @@ class ClipRepository(BaseRepository):
             logger.error(f"Error deleting clip {clip_id} for user {user_id}: {e}")
             return False
 
+    def delete_by_status(self, status: str) -> List[str]:
+        """Delete every clip in a status along with its file, returning the deleted ids
+
+        Used at startup to drop rows reserved by clip creations that never finished.
+        """
+        clips = self.session.query(Clip).filter(Clip.status == status).all()
+        for clip in clips:
+            if clip.file_path:
+                try:
+                    os.remove(clip.file_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as file_error:
+                    logger.error(f"Error deleting clip file {clip.file_path}: {file_error}")
+            self.session.delete(clip)
+
+        self.session.flush()
+        return [clip.id for clip in clips]
+
     def bulk_delete_clips(self, clip_ids: List[str], user_id: str) -> Tuple[int, List[str]]:
         """Bulk delete clips with validation"""
         deleted_count = 0
@@ -407,30 +461,34 @@ class EditRepository(BaseRepository):
 class SnapshotRepository(BaseRepository):
     """Repository for snapshot operations"""
 
+    def _snapshot_row(self, snapshot_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate and sanitize snapshot data into column values"""
+        # Validate required fields
+        required_fields = ["id", "user_id", "file_path"]
+        for field in required_fields:
+            if field not in snapshot_data or not snapshot_data[field]:
+                raise ValueError(f"Required field missing: {field}")
+
+        return {
+            "id": self._sanitize_string_input(snapshot_data["id"], 100),
+            "user_id": self._sanitize_string_input(snapshot_data["user_id"], 100),
+            "file_path": self._sanitize_string_input(snapshot_data["file_path"], 500),
+            "file_size": snapshot_data.get("file_size"),
+            "timestamp": self._sanitize_string_input(snapshot_data.get("timestamp", ""), 20),
+            "format": snapshot_data.get("format", "jpg"),
+            "quality": snapshot_data.get("quality", "high"),
+            "media_title": self._sanitize_string_input(snapshot_data.get("media_title", ""), 200),
+            "show_name": self._sanitize_string_input(snapshot_data.get("show_name", ""), 200),
+            "season_number": snapshot_data.get("season_number"),
+            "episode_number": snapshot_data.get("episode_number"),
+            "status": snapshot_data.get("status", "completed"),
+            "created_at": datetime.utcnow(),
+        }
+
     def create(self, snapshot_data: Dict[str, Any]) -> Snapshot:
         """Create new snapshot with validation"""
         try:
-            # Validate required fields
-            required_fields = ["id", "user_id", "file_path"]
-            for field in required_fields:
-                if field not in snapshot_data or not snapshot_data[field]:
-                    raise ValueError(f"Required field missing: {field}")
-
-            snapshot = Snapshot(
-                id=self._sanitize_string_input(snapshot_data["id"], 100),
-                user_id=self._sanitize_string_input(snapshot_data["user_id"], 100),
-                file_path=self._sanitize_string_input(snapshot_data["file_path"], 500),
-                file_size=snapshot_data.get("file_size"),
-                timestamp=self._sanitize_string_input(snapshot_data.get("timestamp", ""), 20),
-                format=snapshot_data.get("format", "jpg"),
-                quality=snapshot_data.get("quality", "high"),
-                media_title=self._sanitize_string_input(snapshot_data.get("media_title", ""), 200),
-                show_name=self._sanitize_string_input(snapshot_data.get("show_name", ""), 200),
-                season_number=snapshot_data.get("season_number"),
-                episode_number=snapshot_data.get("episode_number"),
-                status=snapshot_data.get("status", "completed"),
-                created_at=datetime.utcnow(),
-            )
+            snapshot = Snapshot(**self._snapshot_row(snapshot_data))
 
             self.session.add(snapshot)
             self.session.flush()
@@ -442,6 +500,22 @@ class SnapshotRepository(BaseRepository):
             logger.error(f"Error creating snapshot: {e}")
             raise
 
+    def bulk_create(self, snapshots_data: List[Dict[str, Any]]) -> int:
+        """Create several snapshots with a single INSERT"""
+        if not snapshots_data:
+            return 0
+
+        try:
+            rows = [self._snapshot_row(data) for data in snapshots_data]
+            self.session.execute(insert(Snapshot), rows)
+
+            logger.info(f"Created {len(rows)} snapshots for user {rows[0]['user_id']}")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Error creating snapshots: {e}")
+            raise
+
     def get_by_id(self, snapshot_id: str, user_id: str) -> Optional[Snapshot]:
         """Get snapshot by ID with user validation"""
         try:
@@ -462,6 +536,51 @@ class SnapshotRepository(BaseRepository):
             logger.error(f"Error getting snapshot {snapshot_id} for user {user_id}: {e}")
             return None
 
+    def get_many(self, snapshot_ids: List[str], user_id: str) -> List[Snapshot]:
+        """Get the user's snapshots among snapshot_ids with a single query"""
+        try:
+            if not snapshot_ids:
+                return []
+
+            return (
+                self.session.query(Snapshot)
+                .filter(
+                    and_(
+                        Snapshot.id.in_(snapshot_ids),
+                        self.query_builder.build_user_filter(self.session, user_id, Snapshot),
+                    )
+                )
+                .all()
+            )
+
+        except Exception as e:
+            logger.error(f"Error getting snapshots for user {user_id}: {e}")
+            return []
+
+    def delete_many(self, snapshot_ids: List[str], user_id: str) -> int:
+        """Delete the user's snapshots among snapshot_ids with a single statement"""
+        try:
+            if not snapshot_ids:
+                return 0
+
+            deleted = (
+                self.session.query(Snapshot)
+                .filter(
+                    and_(
+                        Snapshot.id.in_(snapshot_ids),
+                        self.query_builder.build_user_filter(self.session, user_id, Snapshot),
+                    )
+                )
+                .delete(synchronize_session=False)
+            )
+
+            logger.info(f"Deleted {deleted} snapshots for user {user_id}")
+            return int(deleted)
+
+        except Exception as e:
+            logger.error(f"Error deleting snapshots for user {user_id}: {e}")
+            return 0
+
     def delete(self, snapshot_id: str, user_id: str) -> bool:
         """Delete snapshot with user validation"""
         try:
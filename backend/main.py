@@ -3,9 +3,11 @@ ClipForge Application - Service-oriented architecture
 Phase 2 implementation with proper service layer, dependency injection, and structured logging
 """
 
+import os
+import stat
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, AsyncGenerator, Callable
+from typing import Any, AsyncGenerator, Callable, Optional
 
 from api.middleware import setup_middleware
 
@@ -17,7 +19,7 @@ from core.config import settings
 from core.exceptions import ClipForgeException
 from core.logging import get_logger, set_correlation_id, setup_logging
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 # Infrastructure imports
@@ -35,12 +37,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Initializing database...")
     init_database()
 
+    # Clip rows still "processing" belong to encodes a previous process never finished
+    from services.clip_service import discard_unfinished_clips
+
+    discard_unfinished_clips()
+
     # Initialize cache service
     logger.info("Initializing cache service...")
     from services.cache_service import startup_cache
 
     await startup_cache()
 
+    # The FFmpeg encoder probe blocks, so run it now rather than inside the first clip request
+    from services.clip_service import warm_encoder_probe
+
+    await warm_encoder_probe()
+
     logger.info("ClipForge API initialized successfully")
     logger.info("Service layer architecture active with:")
     logger.info("- Structured logging with correlation IDs")
@@ -58,6 +70,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await shutdown_cache()
 
+    from services.health_service import health_service
+
+    await health_service.stop()
+
+    from services.task_queue import task_queue
+
+    await task_queue.aclose()
+
+    from services.plex_service import close_http_client
+
+    await close_http_client()
+
 
 # Create FastAPI app with enhanced configuration
 app = FastAPI(
@@ -116,15 +140,24 @@ project_root = Path(__file__).parent.parent
 frontend_path = project_root / "frontend"
 
 
+def _stat_frontend_file(path: Path) -> Optional[os.stat_result]:
+    """Stat a frontend page once; the result also spares FileResponse its own stat"""
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
 # Frontend route handlers
 @app.get("/")
 async def serve_index() -> Any:
     """Serve the main application page"""
-    if frontend_path.exists():
-        index_path = frontend_path / "index.html"
-        if index_path.exists():
-            logger.debug("Serving index.html")
-            return FileResponse(str(index_path))
+    index_path = frontend_path / "index.html"
+    index_stat = _stat_frontend_file(index_path)
+    if index_stat is not None:
+        logger.debug("Serving index.html")
+        return FileResponse(str(index_path), stat_result=index_stat)
 
     logger.info("Frontend not found, returning API info")
     return {
@@ -138,17 +171,17 @@ async def serve_index() -> Any:
 @app.get("/login")
 async def serve_login() -> Any:
     """Serve the login page"""
-    if frontend_path.exists():
-        login_path = frontend_path / "login.html"
-        if login_path.exists():
-            logger.debug("Serving login.html")
-            return FileResponse(str(login_path))
+    login_path = frontend_path / "login.html"
+    login_stat = _stat_frontend_file(login_path)
+    if login_stat is not None:
+        logger.debug("Serving login.html")
+        return FileResponse(str(login_path), stat_result=login_stat)
 
     return {"message": "Login page not found", "api_endpoint": "/api/v1/auth/signin"}
 
 
 # Health endpoint
-@app.get("/api/health")
+@app.get("/api/health", response_class=ORJSONResponse)
 async def health() -> Any:
     """Health endpoint"""
     from api.v1 import health_check
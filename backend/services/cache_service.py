@@ -7,6 +7,7 @@ import asyncio
 import json
 import logging
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,8 @@ class CacheService:
         self.plex_metadata_ttl = 600  # 10 minutes
         self.user_session_ttl = 3600  # 1 hour
         self.storage_stats_ttl = 60  # 1 minute
+        self.plex_servers_ttl = 300  # 5 minutes - server topology changes rarely
+        self.plex_identity_ttl = 3600  # 1 hour - a server's machineIdentifier never changes
 
         logger.info("Cache service initialized with in-memory storage")
 
@@ -166,6 +169,70 @@ class CacheService:
         cache_key = f"storage_stats:{user_id}"
         await self.delete(cache_key)
 
+    async def get_plex_servers(self, token_hash: str) -> Optional[Any]:
+        """Get the cached Plex server list for a token"""
+        return await self.get(f"plex_servers:{token_hash}")
+
+    async def set_plex_servers(self, token_hash: str, servers: Any) -> None:
+        """Cache the Plex server list for a token"""
+        await self.set(f"plex_servers:{token_hash}", servers, self.plex_servers_ttl)
+
+    async def get_plex_server_identity(self, token_hash: str) -> Optional[Any]:
+        """Get the cached Plex server identified by an admin token"""
+        return await self.get(f"plex_server_identity:{token_hash}")
+
+    async def set_plex_server_identity(self, token_hash: str, server: Any) -> None:
+        """Cache the Plex server identified by an admin token"""
+        await self.set(f"plex_server_identity:{token_hash}", server, self.plex_servers_ttl)
+
+    async def get_plex_machine_identifier(self, server_url: str) -> Optional[str]:
+        """Get the cached machineIdentifier reported by a server's /identity endpoint"""
+        return await self.get(f"plex_machine_identifier:{server_url}")
+
+    async def set_plex_machine_identifier(self, server_url: str, machine_id: str) -> None:
+        """Cache the machineIdentifier reported by a server's /identity endpoint"""
+        await self.set(f"plex_machine_identifier:{server_url}", machine_id, self.plex_identity_ttl)
+
+    async def invalidate_plex_servers(self, token_hash: str) -> None:
+        """Invalidate cached Plex server lookups for a token (e.g. after it is rejected)"""
+        await self.delete(f"plex_servers:{token_hash}")
+        await self.delete(f"plex_server_identity:{token_hash}")
+
+
+class ThumbnailCache:
+    """Byte-bounded LRU cache for small clip thumbnails produced by FFmpeg"""
+
+    def __init__(self, max_bytes: int = 2 * 1024 * 1024) -> None:
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self.max_bytes = max_bytes
+
+    def get(self, clip_id: str) -> Optional[bytes]:
+        """Get thumbnail bytes for a clip, marking them recently used"""
+        data = self._entries.get(clip_id)
+        if data is not None:
+            self._entries.move_to_end(clip_id)
+        return data
+
+    def set(self, clip_id: str, data: bytes) -> None:
+        """Store thumbnail bytes, evicting least recently used entries over the budget"""
+        if len(data) > self.max_bytes:
+            return
+
+        self.discard(clip_id)
+        self._entries[clip_id] = data
+        self._size += len(data)
+
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def discard(self, clip_id: str) -> None:
+        """Remove a clip's thumbnail from the cache if present"""
+        data = self._entries.pop(clip_id, None)
+        if data is not None:
+            self._size -= len(data)
+
 
 class CacheManager:
     """Global cache manager with background cleanup"""
@@ -224,6 +291,15 @@ def get_cache() -> CacheService:
     return cache_manager.cache
 
 
+# Global thumbnail cache instance
+thumbnail_cache = ThumbnailCache()
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    """Get the global thumbnail cache instance"""
+    return thumbnail_cache
+
+
 async def startup_cache() -> None:
     """Initialize cache on application startup"""
     await cache_manager.start()
@@ -4,11 +4,19 @@ Implements IClipProcessingService interface with proper error handling and loggi
 """
 
 import asyncio
+import builtins
+import functools
+import logging
 import os
+import subprocess  # nosec B404 - fixed argv, used to list FFmpeg encoders
+import time
 import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 
 import ffmpeg  # type: ignore[import-untyped]
 from core.config import settings
@@ -43,6 +51,323 @@ from infrastructure.repositories import (
     SnapshotRepository,
     StorageStatsRepository,
 )
+from services.cache_service import thumbnail_cache
+from services.plex_service import PlexService
+
+try:
+    import av  # type: ignore[import-not-found]
+except ImportError:  # PyAV is optional; frames are then extracted with the FFmpeg CLI
+    av = None
+
+# FFmpeg quality presets, built once and shared read-only across requests
+_VIDEO_QUALITY: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "low": MappingProxyType({"crf": 28, "preset": "fast"}),
+        "medium": MappingProxyType({"crf": 23, "preset": "medium"}),
+        "high": MappingProxyType({"crf": 18, "preset": "slow"}),
+    }
+)
+
+_SNAPSHOT_QUALITY: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "low": MappingProxyType({"qscale:v": 8}),
+        "medium": MappingProxyType({"qscale:v": 4}),
+        "high": MappingProxyType({"qscale:v": 2}),
+    }
+)
+
+# FFmpeg encoder for each snapshot format; frames are piped, so the file extension can't
+# pick the encoder for us
+_IMAGE_ENCODERS: Mapping[str, str] = MappingProxyType(
+    {
+        "jpg": "mjpeg",
+        "jpeg": "mjpeg",
+        "png": "png",
+        "webp": "libwebp",
+        "bmp": "bmp",
+        "tif": "tiff",
+        "tiff": "tiff",
+    }
+)
+
+# Pillow JPEG quality for PyAV-decoded frames, roughly matching the qscale presets above
+_PYAV_JPEG_QUALITY: Mapping[str, int] = MappingProxyType({"low": 65, "medium": 85, "high": 95})
+
+# Output arguments per quality level, built once instead of per request
+_STREAM_COPY_ARGS: Mapping[str, Any] = MappingProxyType(
+    {"c": "copy", "map_metadata": "-1", "avoid_negative_ts": "make_zero"}
+)
+
+_X264_ARGS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        quality: MappingProxyType(
+            {
+                "vcodec": "libx264",
+                "acodec": "aac",
+                "pix_fmt": "yuv420p",
+                "map_metadata": "-1",
+                **preset,
+            }
+        )
+        for quality, preset in _VIDEO_QUALITY.items()
+    }
+)
+
+# New clips are downloaded directly, so they also get faststart and (below high) fastdecode
+_CLIP_X264_ARGS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        quality: MappingProxyType(
+            {
+                **args,
+                "threads": 0,
+                # Put the moov atom up front so downloads can start playing immediately
+                "movflags": "+faststart",
+                **({"tune": "fastdecode"} if quality in ("low", "medium") else {}),
+            }
+        )
+        for quality, args in _X264_ARGS.items()
+    }
+)
+
+# Streams that can be copied into an output container without re-encoding
+_COPYABLE_FORMATS: FrozenSet[str] = frozenset({"mp4"})
+_COPYABLE_VIDEO: FrozenSet[str] = frozenset({"h264", "x264"})
+_COPYABLE_AUDIO: FrozenSet[str] = frozenset({"aac", "mp3"})
+
+# Hardware H.264 encoders selectable through settings.hw_accel
+_HW_ENCODERS: Mapping[str, str] = MappingProxyType({"nvenc": "h264_nvenc", "vaapi": "h264_vaapi"})
+
+# Constant-quality targets for hardware encoders, matching the libx264 CRF levels
+_HW_QUALITY: Mapping[str, int] = MappingProxyType({"low": 28, "medium": 23, "high": 18})
+
+
+@functools.lru_cache(maxsize=1)
+def _available_encoders() -> FrozenSet[str]:
+    """List the encoders compiled into the local FFmpeg binary (probed once per process)"""
+    try:
+        result = subprocess.run(  # nosec B603 B607 - fixed argv, no user input
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+
+    encoders = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        # Encoder rows look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[1] != "=":
+            encoders.add(parts[1])
+    return frozenset(encoders)
+
+
+def discard_unfinished_clips() -> None:
+    """Delete clip rows left in "processing" by a crash or kill, so they free their quota
+
+    Only safe at startup, before any clip creation can be in flight.
+    """
+    with get_db_session() as db:
+        clip_ids = ClipRepository(db).delete_by_status("processing")
+
+    thumbnails_path = settings.absolute_clips_path / "thumbnails"
+    for clip_id in clip_ids:
+        (thumbnails_path / f"thumb_{clip_id}.jpg").unlink(missing_ok=True)
+    if clip_ids:
+        get_logger("clip_processing").info(
+            f"Discarded {len(clip_ids)} clips left unfinished by a previous run"
+        )
+
+
+async def warm_encoder_probe() -> None:
+    """Probe FFmpeg's encoders at startup, off the event loop, when hardware encoding is on"""
+    if settings.hw_accel in _HW_ENCODERS:
+        await asyncio.to_thread(_available_encoders)
+
+
+# Dedicated pool for in-process (PyAV) decoding, so it doesn't queue behind
+# unrelated asyncio.to_thread work in the default executor
+_FFMPEG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.ffmpeg_pool_size or (os.cpu_count() or 1) * 2,
+    thread_name_prefix="ffmpeg",
+)
+
+# Bounds concurrent thumbnail passes that run alongside clip encodes
+_THUMBNAIL_SLOTS = asyncio.Semaphore(settings.max_concurrent_clips)
+
+
+def _ffmpeg_threads(n_workers: int) -> int:
+    """Threads per FFmpeg process when n_workers run at once (total stays near the core count)"""
+    if settings.ffmpeg_threads_per_invocation:
+        return settings.ffmpeg_threads_per_invocation
+    return max(1, (os.cpu_count() or n_workers) // n_workers)
+
+
+# Frame extraction runs in parallel FFmpeg processes with capped decoder threads
+_FRAME_THREADS = 2
+_FRAME_WORKERS = max(1, (os.cpu_count() or 1) // _FRAME_THREADS)
+_FRAME_SLOTS = asyncio.Semaphore(_FRAME_WORKERS)
+# Each extra process re-seeks from the previous keyframe, so don't split short runs
+_MIN_FRAMES_PER_RUN = 4
+
+
+async def _run_ffmpeg_args(args: List[str]) -> bytes:
+    """Run a compiled FFmpeg command line and return its stdout (raises MediaProcessingError)"""
+    # FFmpeg runs as a child process the event loop awaits, so no worker thread is held
+    process = await asyncio.create_subprocess_exec(  # nosec B603 - argv list
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        details = stderr.decode("utf-8") if stderr else "No error details"
+        raise MediaProcessingError(f"FFmpeg error: {details}")
+    return stdout
+
+
+def _decode_frames_pyav(
+    source_path: str,
+    frame_numbers: List[int],
+    fps: float,
+    jpeg_quality: int,
+    snapshots_dir: Path,
+    image_format: str,
+) -> List[Tuple[int, str, Path, int]]:
+    """
+    Decode a contiguous run of frames in-process with PyAV
+
+    Returns (frame_number, frame_id, output_path, file_size) for each frame written.
+    """
+    extracted: List[Tuple[int, str, Path, int]] = []
+    targets = iter(frame_numbers)
+    target = next(targets, None)
+    try:
+        with av.open(source_path) as container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            stream.thread_count = _ffmpeg_threads(_FRAME_WORKERS)
+            # Seek lands on the keyframe at or before the first frame; decode forward from there
+            container.seek(int(frame_numbers[0] / fps / stream.time_base), stream=stream)
+
+            for frame in container.decode(stream):
+                if target is None:
+                    break
+                if frame.time is None or round(frame.time * fps) < target:
+                    continue
+
+                frame_id = str(uuid.uuid4())
+                output_path = snapshots_dir / f"frame_{frame_id}.{image_format}"
+                # to_image() converts to RGB, so no BGR channel swap is needed
+                frame.to_image().save(output_path, quality=jpeg_quality)
+                extracted.append((target, frame_id, output_path, output_path.stat().st_size))
+                target = next(targets, None)
+    except Exception:
+        # Leave nothing behind for the FFmpeg fallback to duplicate
+        for _, _, output_path, _ in extracted:
+            output_path.unlink(missing_ok=True)
+        raise
+
+    return extracted
+
+
+def _output_flags(options: Mapping[str, Any]) -> List[str]:
+    """Turn FFmpeg option kwargs into argv flags, as ffmpeg-python would"""
+    flags = []
+    for name, value in options.items():
+        flags += [f"-{name}", str(value)]
+    return flags
+
+
+def _unlink_paths(paths: List[str]) -> Dict[str, str]:
+    """Remove files, ignoring ones already gone; returns an error message per failed path"""
+    failures: Dict[str, str] = {}
+
+    # Frames share a few directories, so resolve each directory once and unlink by
+    # name relative to its descriptor instead of walking the full path per file
+    by_directory: Dict[str, List[str]] = {}
+    for path in paths:
+        by_directory.setdefault(os.path.dirname(path), []).append(path)
+
+    use_dir_fd = os.unlink in os.supports_dir_fd
+    for directory, dir_paths in by_directory.items():
+        dir_fd: Optional[int] = None
+        if use_dir_fd and len(dir_paths) > 1:
+            try:
+                dir_fd = os.open(directory or ".", os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                dir_fd = None
+
+        try:
+            for path in dir_paths:
+                try:
+                    if dir_fd is not None:
+                        os.unlink(os.path.basename(path), dir_fd=dir_fd)
+                    else:
+                        os.unlink(path)
+                except builtins.FileNotFoundError:
+                    pass
+                except OSError as e:
+                    failures[path] = str(e)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+    return failures
+
+
+class StreamSummary(NamedTuple):
+    """The few probe fields needed for stream-copy decisions and frame stepping"""
+
+    video_codec: Optional[str]
+    audio_codec: str
+    container: str
+    frame_rate: Optional[str]
+
+
+def _probe_light(path: str) -> StreamSummary:
+    """Probe a media file and keep only the codec/container fields"""
+    probe = ffmpeg.probe(path)
+    video_codec: Optional[str] = None
+    frame_rate: Optional[str] = None
+    audio_codec = ""
+    for stream in probe["streams"]:
+        codec_type = stream.get("codec_type")
+        if codec_type == "video" and video_codec is None:
+            video_codec = stream.get("codec_name", "").lower()
+            frame_rate = stream.get("r_frame_rate")
+        elif codec_type == "audio" and not audio_codec:
+            audio_codec = stream.get("codec_name", "")
+    container = probe["format"]["format_name"].lower()
+    # Drop the full probe JSON now rather than holding it for the caller's lifetime
+    del probe
+    return StreamSummary(video_codec, audio_codec, container, frame_rate)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_stream_summary(path: str, mtime_ns: int) -> StreamSummary:
+    """Stream summary keyed on path and modification time so edits invalidate it"""
+    return _probe_light(path)
+
+
+def _stream_summary(path: str) -> StreamSummary:
+    """Get the (cached) stream summary for the current version of a file"""
+    return _cached_stream_summary(path, os.stat(path).st_mtime_ns)
+
+
+# One lock per source being probed, so concurrent requests for the same file
+# wait for the first probe instead of each starting their own
+_PROBE_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+async def _get_stream_summary(path: str) -> StreamSummary:
+    """Get the stream summary without blocking the event loop"""
+    lock = _PROBE_LOCKS.get(path)
+    if lock is None:
+        lock = _PROBE_LOCKS[path] = asyncio.Lock()
+    async with lock:
+        # ffprobe is a blocking subprocess, keep it off the event loop
+        return await asyncio.to_thread(_stream_summary, path)
 
 
 class TimeUtils:
@@ -99,6 +424,8 @@ class ClipProcessingService(IClipProcessingService):
         # Test mode configuration (from settings, which loads .env file)
         self.test_mode = settings.test_mode
         self.test_video_file = settings.test_video_file
+        self._resolved_test_video: Optional[str] = None
+        self._plex_service: Optional[PlexService] = None
 
         # Log test mode configuration
         if self.test_mode:
@@ -106,10 +433,21 @@ class ClipProcessingService(IClipProcessingService):
         else:
             self.logger.info("Test mode DISABLED - using Plex media files")
 
+    @property
+    def plex_service(self) -> PlexService:
+        """Get or create the Plex service used for source path lookups"""
+        if self._plex_service is None:
+            self._plex_service = PlexService()
+        return self._plex_service
+
     async def _get_source_path(self, session: SessionInfo, plex_token: str) -> str:
         """Get the source file path, using test file if in test mode"""
         if self.test_mode:
-            self.logger.info(f"Test mode active - looking for test video: {self.test_video_file}")
+            # Reuse the previously resolved location while it is still on disk
+            if self._resolved_test_video and os.path.exists(self._resolved_test_video):
+                return self._resolved_test_video
+
+            self.logger.info("Test mode active - looking for test video: %s", self.test_video_file)
             possible_paths = [
                 self.test_video_file if os.path.isabs(self.test_video_file) else None,
                 self.test_video_file,
@@ -122,44 +460,41 @@ class ClipProcessingService(IClipProcessingService):
 
             for path in possible_paths:
                 if path and os.path.exists(path):
-                    self.logger.info(f"Found test video at: {path}")
-                    return os.path.abspath(path)
+                    self.logger.info("Found test video at: %s", path)
+                    self._resolved_test_video = os.path.abspath(path)
+                    return self._resolved_test_video
                 elif path:
-                    self.logger.debug(f"Test video not found at: {path}")
+                    self.logger.debug("Test video not found at: %s", path)
 
-            self.logger.error(f"Test video file not found in any location: {self.test_video_file}")
+            self.logger.error("Test video file not found in any location: %s", self.test_video_file)
             raise FileNotFoundError(f"Test video file not found: {self.test_video_file}")
         else:
             # Use Plex file path
-            self.logger.info(f"Getting source path for media key: {session.media.key}")
+            self.logger.info("Getting source path for media key: %s", session.media.key)
 
             # Check if original_file_info is already available
             if hasattr(session, "original_file_info") and session.original_file_info:
                 self.logger.info(
-                    f"Using existing original_file_info: {session.original_file_info.file_path}"
+                    "Using existing original_file_info: %s", session.original_file_info.file_path
                 )
             else:
                 self.logger.warning("original_file_info is not available, attempting to fetch it")
 
                 # Try to get server context from session or create Plex service to fetch it
-                server_context = getattr(session, "_server_context", None)
+                server_context = session.server_context
 
                 if not server_context:
                     self.logger.warning(
                         "No server context available, attempting to get current session with context"
                     )
-                    from services.plex_service import PlexService
-
-                    plex_service = PlexService()
-
                     # Try to get the current session with server context
                     try:
-                        current_session = await plex_service.get_current_session(
+                        current_session = await self.plex_service.get_current_session(
                             plex_token, session.username
                         )
-                        if current_session and hasattr(current_session, "_server_context"):
-                            server_context = getattr(current_session, "_server_context", None)
-                            setattr(session, "_server_context", server_context)
+                        if current_session and current_session.server_context:
+                            server_context = current_session.server_context
+                            session.server_context = server_context
                             self.logger.info(
                                 "Successfully retrieved server context from current session"
                             )
@@ -168,51 +503,62 @@ class ClipProcessingService(IClipProcessingService):
                                 "Could not retrieve server context from current session"
                             )
                     except Exception as e:
-                        self.logger.error(f"Failed to get current session with context: {e}")
+                        self.logger.error("Failed to get current session with context: %s", e)
 
                 if server_context and plex_token:
-                    from core.config import settings
-                    from services.plex_service import PlexService
-
-                    plex_service = PlexService()
-
                     media_key = session.media.key
                     if media_key:
                         try:
                             self.logger.info(
-                                f"Attempting to get media file info for key: {media_key}"
+                                "Attempting to get media file info for key: %s", media_key
                             )
 
                             # Use server token if available for file access (admin privileges needed)
                             token_to_use = plex_token
-                            self.logger.info(
-                                f"Checking for server token: has_attr={hasattr(settings, 'plex_server_token')}, value={'set' if getattr(settings, 'plex_server_token', None) else 'not set'}"
-                            )
+                            log_tokens = self.logger.isEnabledFor(logging.INFO)
+                            if log_tokens:
+                                self.logger.info(
+                                    "Checking for server token: has_attr=%s, value=%s",
+                                    hasattr(settings, "plex_server_token"),
+                                    (
+                                        "set"
+                                        if getattr(settings, "plex_server_token", None)
+                                        else "not set"
+                                    ),
+                                )
                             if (
                                 hasattr(settings, "plex_server_token")
                                 and settings.plex_server_token
                             ):
-                                self.logger.info(
-                                    f"Using server token for file path access (token: {settings.plex_server_token[:5]}...{settings.plex_server_token[-5:]})"
-                                )
+                                if log_tokens:
+                                    self.logger.info(
+                                        "Using server token for file path access (token: %s...%s)",
+                                        settings.plex_server_token[:5],
+                                        settings.plex_server_token[-5:],
+                                    )
                                 token_to_use = settings.plex_server_token
-                            else:
+                            elif log_tokens:
                                 self.logger.info(
-                                    f"Using user token for file path access (token: {plex_token[:5]}...{plex_token[-5:] if plex_token else 'None'})"
+                                    "Using user token for file path access (token: %s...%s)",
+                                    plex_token[:5],
+                                    plex_token[-5:] if plex_token else "None",
                                 )
 
-                            original_file_info = await plex_service.get_media_file_info(
+                            original_file_info = await self.plex_service.get_media_file_info(
                                 token_to_use, server_context, media_key
                             )
                             session.original_file_info = original_file_info
                             self.logger.info(
-                                f"Successfully retrieved file info: {original_file_info.file_path if original_file_info else 'None'}"
+                                "Successfully retrieved file info: %s",
+                                original_file_info.file_path if original_file_info else "None",
                             )
                         except Exception as e:
-                            self.logger.error(f"Failed to get media file info: {e}")
+                            self.logger.error("Failed to get media file info: %s", e)
                 else:
                     self.logger.error(
-                        f"Missing required parameters - server_context: {bool(server_context)}, plex_token: {bool(plex_token)}"
+                        "Missing required parameters - server_context: %s, plex_token: %s",
+                        bool(server_context),
+                        bool(plex_token),
                     )
 
             # Check if we now have the file info
@@ -222,73 +568,98 @@ class ClipProcessingService(IClipProcessingService):
                 and session.original_file_info.file_path
             ):
                 file_path = session.original_file_info.file_path
-                self.logger.info(f"Using file path: {file_path}")
+                self.logger.info("Using file path: %s", file_path)
                 if not os.path.exists(file_path):
                     raise FileNotFoundError(f"Source file not found: {file_path}")
                 return file_path
 
             # If we still don't have file info, provide more detailed error
-            session_info_details = {
-                "original_file_info": getattr(session, "original_file_info", "Not set"),
-                "_server_context": bool(getattr(session, "_server_context", None)),
-                "media_key": session.media.key,
-                "username": session.username,
-                "media_streams_count": (
-                    len(session.media.media_streams)
-                    if hasattr(session.media, "media_streams")
-                    else 0
-                ),
-            }
-            self.logger.error(
-                f"No source file information available. Session details: {session_info_details}"
-            )
+            if self.logger.isEnabledFor(logging.ERROR):
+                session_info_details = {
+                    "original_file_info": getattr(session, "original_file_info", "Not set"),
+                    "server_context": bool(session.server_context),
+                    "media_key": session.media.key,
+                    "username": session.username,
+                    "media_streams_count": (
+                        len(session.media.media_streams)
+                        if hasattr(session.media, "media_streams")
+                        else 0
+                    ),
+                }
+                self.logger.error(
+                    "No source file information available. Session details: %s",
+                    session_info_details,
+                )
             raise FileNotFoundError(
                 "No source file information available. Unable to fetch file path from Plex server."
             )
 
-    def _get_quality_settings(self, quality: str, is_snapshot: bool = False) -> Dict[str, Any]:
-        """Get FFmpeg quality settings based on quality level"""
-        settings_map: Dict[str, Dict[str, Any]]
-        if is_snapshot:
-            settings_map = {
-                "low": {"qscale:v": 8},
-                "medium": {"qscale:v": 4},
-                "high": {"qscale:v": 2},
-            }
+    def _get_quality_settings(self, quality: str, is_snapshot: bool = False) -> Mapping[str, Any]:
+        """Get FFmpeg quality settings based on quality level (read-only, merge with **)"""
+        settings_map = _SNAPSHOT_QUALITY if is_snapshot else _VIDEO_QUALITY
+        return settings_map.get(quality, settings_map["medium"])
+
+    def _get_hw_encoder(self) -> Optional[str]:
+        """Get the configured hardware H.264 encoder if the local FFmpeg supports it"""
+        encoder = _HW_ENCODERS.get(settings.hw_accel)
+        if encoder and encoder in _available_encoders():
+            return encoder
+        return None
+
+    def _get_hw_encode_args(
+        self, encoder: str, quality: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Get FFmpeg input and output arguments for a hardware H.264 encode"""
+        level = _HW_QUALITY.get(quality, _HW_QUALITY["medium"])
+        output_args: Dict[str, Any] = {
+            "vcodec": encoder,
+            "acodec": "aac",
+            "map_metadata": "-1",
+            "movflags": "+faststart",
+        }
+
+        if encoder == "h264_nvenc":
+            # Decode on the GPU too so frames never leave device memory
+            input_args: Dict[str, Any] = {"hwaccel": "cuda", "hwaccel_output_format": "cuda"}
+            output_args.update({"preset": "p4", "rc": "vbr", "cq": level})
         else:
-            settings_map = {
-                "low": {"crf": 28, "preset": "fast"},
-                "medium": {"crf": 23, "preset": "medium"},
-                "high": {"crf": 18, "preset": "slow"},
+            input_args = {
+                "hwaccel": "vaapi",
+                "hwaccel_device": settings.hw_accel_device,
+                "hwaccel_output_format": "vaapi",
             }
+            output_args["qp"] = level
 
-        return settings_map.get(quality, settings_map["medium"])
+        return input_args, output_args
 
-    def _can_copy_streams(self, source_path: str, target_format: str) -> bool:
+    async def _run_ffmpeg(self, output_stream: Any) -> bytes:
+        """Compile an ffmpeg-python output stream and run it with retries, returning stdout"""
+        args = ffmpeg.compile(output_stream, overwrite_output=True)
+        stdout: bytes = await retry_async(_run_ffmpeg_args, args, strategy=FFMPEG_RETRY)
+        return stdout
+
+    async def _can_copy_streams(self, source_path: str, target_format: str) -> bool:
         """Check if we can copy streams without re-encoding for speed"""
         try:
-            probe = ffmpeg.probe(source_path)
-            video_stream = next((s for s in probe["streams"] if s["codec_type"] == "video"), None)
-            audio_stream = next((s for s in probe["streams"] if s["codec_type"] == "audio"), None)
-
-            if not video_stream:
-                return False
-
-            source_container = probe["format"]["format_name"].lower()
-            video_codec = video_stream.get("codec_name", "").lower()
-            audio_codec = audio_stream.get("codec_name", "") if audio_stream else ""
-
-            if target_format == "mp4":
-                return (
-                    video_codec in ["h264", "x264"]
-                    and audio_codec in ["aac", "mp3"]
-                    and "mp4" in source_container
-                )
+            summary = await _get_stream_summary(source_path)
 
-            return False
+            return target_format in summary.container and self._streams_copyable(
+                summary.video_codec, summary.audio_codec, target_format
+            )
         except Exception:
             return False
 
+    @staticmethod
+    def _streams_copyable(
+        video_codec: Optional[str], audio_codec: Optional[str], target_format: str
+    ) -> bool:
+        """Check whether streams with these codecs can be copied into target_format"""
+        return (
+            target_format in _COPYABLE_FORMATS
+            and video_codec in _COPYABLE_VIDEO
+            and audio_codec in _COPYABLE_AUDIO
+        )
+
     def _generate_clip_title(self, session: SessionInfo) -> str:
         """Generate a meaningful title based on session information"""
         title = session.media.title or "Untitled"
@@ -315,28 +686,17 @@ class ClipProcessingService(IClipProcessingService):
         user_id: str,
     ) -> ClipResponse:
         """Create a video clip from current session"""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         clip_id = str(uuid.uuid4())
+        # True from the reservation until the row is marked completed; any exit in between,
+        # including cancellation, discards the row so it never counts against the video limit
+        pending = False
 
         try:
             self.logger.info(
                 f"Starting clip creation for user {user_id}", extra={"user_id": user_id}
             )
 
-            # Check video limit before processing
-            with get_db_session() as db_session:
-                storage_repo = StorageStatsRepository(db_session)
-                current_video_count = storage_repo.get_user_video_count(user_id)
-
-                if current_video_count >= settings.user_video_limit:
-                    raise VideoLimitExceededException(
-                        f"Video limit exceeded. Maximum {settings.user_video_limit} videos allowed. "
-                        f"Current count: {current_video_count}"
-                    )
-
-            # Get source path
-            source_path = await self._get_source_path(session, plex_token)
-
             # Calculate timing and validate
             start_seconds = TimeUtils.parse_time_to_seconds(request.start_time)
             duration = TimeUtils.calculate_duration(request.start_time, request.end_time)
@@ -344,6 +704,7 @@ class ClipProcessingService(IClipProcessingService):
             # Generate output path
             filename = f"{clip_id}.{request.format}"
             output_path = self.clips_storage_path / "videos" / filename
+            out_str = str(output_path)
 
             # Create metadata
             title = self._generate_clip_title(session)
@@ -360,192 +721,130 @@ class ClipProcessingService(IClipProcessingService):
                 created_at=datetime.now().isoformat() + "Z",
             )
 
-            # Prepare FFmpeg command
-            input_stream = ffmpeg.input(source_path, ss=start_seconds, t=duration)
+            # Check video limit and reserve the clip row in the same transaction
+            with get_db_session() as db_session:
+                storage_repo = StorageStatsRepository(db_session)
+                current_video_count = storage_repo.get_user_video_count(user_id)
 
-            if self._can_copy_streams(source_path, request.format):
-                output_args = {
-                    "c": "copy",
-                    "map_metadata": "-1",
-                    "avoid_negative_ts": "make_zero",
-                }
-            else:
-                quality_settings = self._get_quality_settings(request.quality)
-                output_args = {
-                    "vcodec": "libx264",
-                    "acodec": "aac",
-                    "pix_fmt": "yuv420p",
-                    "map_metadata": "-1",
-                    **quality_settings,
-                }
+                if current_video_count >= settings.user_video_limit:
+                    raise VideoLimitExceededException(
+                        f"Video limit exceeded. Maximum {settings.user_video_limit} videos allowed. "
+                        f"Current count: {current_video_count}"
+                    )
 
-            # Add metadata if requested
+                clip_repo = ClipRepository(db_session)
+                clip_repo.create(
+                    {
+                        "id": clip_id,
+                        "user_id": user_id,
+                        "title": title,
+                        "file_path": out_str,
+                        "duration": duration,
+                        "status": "processing",
+                        "show_name": metadata.show_name,
+                        "season_number": metadata.season_number,
+                        "episode_number": metadata.episode_number,
+                        "original_timestamp": metadata.original_timestamp,
+                    }
+                )
+            pending = True
+
+            # Get source path
+            source_path = await self._get_source_path(session, plex_token)
+
+            # Prepare FFmpeg command
+            can_copy = await self._can_copy_streams(source_path, request.format)
+            hw_encoder = None if can_copy else self._get_hw_encoder()
+
+            # Add metadata if requested (one -metadata flag per tag, since ffmpeg-python
+            # collapses repeated output kwargs)
+            metadata_flags: List[str] = []
             if request.include_metadata:
-                metadata_args = {
-                    "metadata": f"title={metadata.title}",
-                    "metadata:g:0": f"comment=Created at {metadata.original_timestamp} by {metadata.username}",
-                }
+                metadata_flags = [
+                    "-metadata",
+                    f"title={metadata.title}",
+                    "-metadata",
+                    f"comment=Created at {metadata.original_timestamp} by {metadata.username}",
+                ]
                 if metadata.show_name:
-                    metadata_args["metadata:g:1"] = f"show={metadata.show_name}"
+                    metadata_flags += ["-metadata", f"show={metadata.show_name}"]
                 if metadata.season_number:
-                    metadata_args["metadata:g:2"] = f"season_number={metadata.season_number}"
+                    metadata_flags += ["-metadata", f"season_number={metadata.season_number}"]
                 if metadata.episode_number:
-                    metadata_args["metadata:g:3"] = f"episode_number={metadata.episode_number}"
+                    metadata_flags += ["-metadata", f"episode_number={metadata.episode_number}"]
+
+            def build_ffmpeg_args(encoder: Optional[str]) -> List[str]:
+                input_args: Mapping[str, Any] = {}
+                output_args: Mapping[str, Any]
+                if can_copy:
+                    output_args = _STREAM_COPY_ARGS
+                elif encoder:
+                    input_args, output_args = self._get_hw_encode_args(encoder, request.quality)
+                else:
+                    output_args = _CLIP_X264_ARGS.get(request.quality, _CLIP_X264_ARGS["medium"])
 
-                output_args.update(metadata_args)
+                input_stream = ffmpeg.input(source_path, ss=start_seconds, t=duration, **input_args)
+                args = ffmpeg.compile(ffmpeg.output(input_stream, out_str, **output_args))
+                # The output file is the last argv entry; metadata flags must precede it
+                return [args[0], "-y", *args[1:-1], *metadata_flags, args[-1]]
 
             # Execute FFmpeg with retry logic
-            output_stream = ffmpeg.output(input_stream, str(output_path), **output_args)
-
-            def run_ffmpeg() -> None:
+            async def encode_clip() -> None:
                 try:
-                    ffmpeg.run(
-                        output_stream,
-                        capture_stdout=True,
-                        capture_stderr=True,
-                        overwrite_output=True,
+                    await retry_async(
+                        _run_ffmpeg_args, build_ffmpeg_args(hw_encoder), strategy=FFMPEG_RETRY
+                    )
+                except MediaProcessingError as e:
+                    if not hw_encoder:
+                        raise
+                    self.logger.warning(
+                        f"Hardware encode with {hw_encoder} failed, falling back to libx264: {e}"
+                    )
+                    await retry_async(
+                        _run_ffmpeg_args, build_ffmpeg_args(None), strategy=FFMPEG_RETRY
                     )
-                except ffmpeg.Error as e:
-                    stderr = e.stderr.decode("utf-8") if e.stderr else "No error details"
-                    raise MediaProcessingError(f"FFmpeg error: {stderr}")
-
-            loop = asyncio.get_event_loop()
-            await retry_async(lambda: loop.run_in_executor(None, run_ffmpeg), strategy=FFMPEG_RETRY)
-
-            # Wait for file to be fully written with retries
-            # Initial wait to allow FFmpeg to finish writing
-            await asyncio.sleep(1.0)  # 1 second initial wait
-
-            max_retries = 50  # Increased retries
-            file_ready = False
-            last_size = 0
-            stable_checks = 0
-            minimum_file_size = 1024  # Minimum 1KB to ensure we don't catch partial writes
-
-            for i in range(max_retries):
-                await asyncio.sleep(0.3)  # 300ms wait each time
-
-                if output_path.exists() or output_path.absolute().exists():
-                    try:
-                        current_size = (
-                            output_path.stat().st_size
-                            if output_path.exists()
-                            else output_path.absolute().stat().st_size
-                        )
-
-                        # Check if file size is stable and above minimum threshold
-                        if current_size >= minimum_file_size and current_size == last_size:
-                            stable_checks += 1
-                            if stable_checks >= 3:  # File size stable for 3 checks (900ms)
-                                file_ready = True
-                                self.logger.info(f"File ready, final size: {current_size} bytes")
-                                break
-                        else:
-                            if current_size != last_size:
-                                stable_checks = 0  # Reset if size changed
-
-                        last_size = current_size
-                    except OSError:
-                        # File might be locked, continue waiting
-                        pass
 
-            if not file_ready:
-                self.logger.warning(
-                    f"File stability timeout after {max_retries} retries, last size: {last_size}"
-                )
-                # Continue anyway if file exists and has some content
+            # The thumbnail reads the source independently of the encode, so run both at once
+            encode_result, thumbnail_url = await asyncio.gather(
+                encode_clip(),
+                self._generate_clip_thumbnail(clip_id, source_path, start_seconds),
+                return_exceptions=True,
+            )
+            if isinstance(encode_result, BaseException):
+                raise encode_result
+            if isinstance(thumbnail_url, BaseException):
+                thumbnail_url = None
 
-            # Get file info
+            # FFmpeg has exited once the encode is awaited, so the file is complete.
+            # output_path is already absolute, a single stat is enough
             try:
-                # Try both relative and absolute paths
-                if output_path.exists():
-                    file_size = output_path.stat().st_size
-                elif output_path.absolute().exists():
-                    self.logger.warning(f"File found with absolute path: {output_path.absolute()}")
-                    file_size = output_path.absolute().stat().st_size
-                else:
-                    # Try with os.path.exists as last resort
-                    str_path = str(output_path)
-                    if os.path.exists(str_path):
-                        self.logger.warning(f"File found with os.path.exists: {str_path}")
-                        file_size = os.path.getsize(str_path)
-                    else:
-                        self.logger.error(f"File does not exist after FFmpeg: {output_path}")
-                        raise StorageError(f"Output file does not exist: {output_path}")
+                file_size = os.stat(out_str).st_size
+            except builtins.FileNotFoundError:
+                self.logger.error(f"File does not exist after FFmpeg: {output_path}")
+                raise StorageError(f"Output file does not exist: {output_path}")
             except OSError as e:
                 self.logger.error(f"OSError getting file size for {output_path}: {e}")
                 raise StorageError(f"Failed to get file size: {e}")
 
             download_url = f"/api/v1/storage/video/{clip_id}"
 
-            # Generate thumbnail from first frame
-            thumbnail_url = None
-            try:
-                thumbnail_filename = f"thumb_{clip_id}.jpg"
-                thumbnail_path = self.clips_storage_path / "thumbnails" / thumbnail_filename
-
-                # Extract first frame (at 0 seconds) as thumbnail
-                thumbnail_input = ffmpeg.input(str(output_path), ss=0)
-                thumbnail_output = ffmpeg.output(
-                    thumbnail_input,
-                    str(thumbnail_path),
-                    vframes=1,
-                    s="320x180",  # Small thumbnail size
-                    q=3,  # High quality JPEG
-                )
-
-                def run_thumbnail_ffmpeg() -> None:
-                    try:
-                        ffmpeg.run(
-                            thumbnail_output,
-                            capture_stdout=True,
-                            capture_stderr=True,
-                            overwrite_output=True,
-                        )
-                    except ffmpeg.Error as e:
-                        # Log but don't fail clip creation if thumbnail fails
-                        stderr = e.stderr.decode("utf-8") if e.stderr else "No error details"
-                        self.logger.warning(
-                            f"Thumbnail generation failed for clip {clip_id}: {stderr}"
-                        )
-                        raise
-
-                # Generate thumbnail asynchronously
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, run_thumbnail_ffmpeg)
-
-                # Check if thumbnail was created successfully
-                if thumbnail_path.exists() and thumbnail_path.stat().st_size > 0:
-                    thumbnail_url = f"/api/v1/storage/thumbnail/{clip_id}"
-                    self.logger.info(f"Successfully generated thumbnail for clip {clip_id}")
-                else:
-                    self.logger.warning(f"Thumbnail file not found or empty for clip {clip_id}")
-
-            except Exception as e:
-                # Don't fail clip creation if thumbnail generation fails
-                self.logger.warning(f"Failed to generate thumbnail for clip {clip_id}: {e}")
+            # Record the output streams so edits of this clip can skip the probe
+            if can_copy:
+                summary = await _get_stream_summary(source_path)
+                stream_info = (summary.video_codec, summary.audio_codec, request.format)
+            else:
+                stream_info = ("h264", "aac", request.format)
 
-            # Store in database
+            # Mark the reserved clip as completed
             with get_db_session() as db:
                 clip_repo = ClipRepository(db)
-                clip_repo.create(
-                    {
-                        "id": clip_id,
-                        "user_id": user_id,
-                        "title": title,
-                        "file_path": str(output_path),
-                        "file_size": file_size,
-                        "duration": duration,
-                        "status": "completed",
-                        "show_name": metadata.show_name,
-                        "season_number": metadata.season_number,
-                        "episode_number": metadata.episode_number,
-                        "original_timestamp": metadata.original_timestamp,
-                    }
+                clip_repo.update_status(
+                    clip_id, user_id, "completed", file_size=file_size, stream_info=stream_info
                 )
+            pending = False
 
             # Log performance
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             performance_logger.log_media_processing_duration(
                 "clip_creation", file_size / (1024 * 1024), processing_time
             )
@@ -558,7 +857,7 @@ class ClipProcessingService(IClipProcessingService):
             return ClipResponse(
                 clip_id=clip_id,
                 status="completed",
-                file_path=str(output_path),
+                file_path=out_str,
                 download_url=download_url,
                 thumbnail_url=thumbnail_url,
                 file_size=file_size,
@@ -572,6 +871,61 @@ class ClipProcessingService(IClipProcessingService):
         except Exception as e:
             self.logger.error(f"Unexpected error creating clip: {e}", extra={"user_id": user_id})
             raise ClipProcessingError(f"Clip creation failed: {str(e)}")
+        finally:
+            if pending:
+                self._discard_reserved_clip(clip_id, user_id)
+
+    async def _generate_clip_thumbnail(
+        self, clip_id: str, source_path: str, start_seconds: float
+    ) -> Optional[str]:
+        """Extract a small thumbnail for a clip, returning its URL (None if it failed)"""
+        thumbnail_path = self.clips_storage_path / "thumbnails" / f"thumb_{clip_id}.jpg"
+
+        try:
+            # Extract the clip's first frame straight from the source, so the
+            # freshly written MP4 never has to be demuxed again
+            thumbnail_input = ffmpeg.input(source_path, ss=start_seconds)
+            thumbnail_output = ffmpeg.output(
+                thumbnail_input,
+                "pipe:",  # Read the JPEG from stdout instead of re-reading it from disk
+                format="mjpeg",
+                vframes=1,
+                s="320x180",  # Small thumbnail size
+                q=3,  # High quality JPEG
+            )
+            thumbnail_args = ffmpeg.compile(thumbnail_output)
+
+            async with _THUMBNAIL_SLOTS:
+                thumbnail_data = await _run_ffmpeg_args(thumbnail_args)
+
+            if not thumbnail_data:
+                self.logger.warning(f"Thumbnail output is empty for clip {clip_id}")
+                return None
+
+            # Serve from memory; the single disk write keeps it across restarts and workers
+            thumbnail_cache.set(clip_id, thumbnail_data)
+            await asyncio.to_thread(thumbnail_path.write_bytes, thumbnail_data)
+
+            self.logger.info(f"Successfully generated thumbnail for clip {clip_id}")
+            return f"/api/v1/storage/thumbnail/{clip_id}"
+
+        except Exception as e:
+            # Don't fail clip creation if thumbnail generation fails
+            self.logger.warning(f"Failed to generate thumbnail for clip {clip_id}: {e}")
+
+        return None
+
+    def _discard_reserved_clip(self, clip_id: str, user_id: str) -> None:
+        """Remove a clip row reserved by create_clip (and any partial output) after a failure"""
+        try:
+            with get_db_session() as db:
+                clip_repo = ClipRepository(db)
+                clip_repo.delete_clip(clip_id, user_id)
+            thumbnail_cache.discard(clip_id)
+            thumbnail_path = self.clips_storage_path / "thumbnails" / f"thumb_{clip_id}.jpg"
+            thumbnail_path.unlink(missing_ok=True)
+        except Exception as e:
+            self.logger.warning(f"Failed to discard reserved clip {clip_id}: {e}")
 
     async def delete_clip(self, clip_id: str, user_id: str) -> bool:
         """Delete a clip and its associated thumbnail"""
@@ -590,30 +944,18 @@ class ClipProcessingService(IClipProcessingService):
                     self.logger.warning(f"Clip {clip_id} not found for user {user_id}")
                     return False
 
+                file_path = clip.file_path
+
                 # Delete from database first
                 if not clip_repo.delete_clip(clip_id, user_id):
                     self.logger.warning(f"Failed to delete clip {clip_id} from database")
                     return False
 
-            # Then clean up files
+            # Then clean up files off the event loop; the thumbnail cache is only touched
+            # from the loop, so drop its entry here
+            thumbnail_cache.discard(clip_id)
             try:
-                # Delete video file
-                video_path = Path(clip.file_path)
-                if video_path.exists():
-                    video_path.unlink()
-                    self.logger.info(f"Deleted video file: {video_path}")
-                else:
-                    self.logger.warning(f"Video file not found: {video_path}")
-
-                # Delete thumbnail file
-                thumbnail_filename = f"thumb_{clip_id}.jpg"
-                thumbnail_path = self.clips_storage_path / "thumbnails" / thumbnail_filename
-                if thumbnail_path.exists():
-                    thumbnail_path.unlink()
-                    self.logger.info(f"Deleted thumbnail file: {thumbnail_path}")
-                else:
-                    self.logger.debug(f"Thumbnail file not found: {thumbnail_path}")
-
+                await asyncio.to_thread(self._remove_clip_files, file_path, clip_id)
             except Exception as e:
                 # Log file deletion errors but don't fail the operation since DB is already updated
                 self.logger.warning(f"Error cleaning up files for clip {clip_id}: {e}")
@@ -625,6 +967,13 @@ class ClipProcessingService(IClipProcessingService):
             self.logger.error(f"Error deleting clip {clip_id} for user {user_id}: {e}")
             return False
 
+    def _remove_clip_files(self, file_path: str, clip_id: str) -> None:
+        """Remove a clip's video and thumbnail files, ignoring any already gone"""
+        Path(file_path).unlink(missing_ok=True)
+        thumbnail_path = self.clips_storage_path / "thumbnails" / f"thumb_{clip_id}.jpg"
+        thumbnail_path.unlink(missing_ok=True)
+        self.logger.debug(f"Removed files for clip {clip_id}: {file_path}, {thumbnail_path}")
+
     async def bulk_delete_clips(self, clip_ids: List[str], user_id: str) -> Tuple[int, List[str]]:
         """Delete multiple clips and their thumbnails"""
         deleted_count = 0
@@ -656,7 +1005,7 @@ class ClipProcessingService(IClipProcessingService):
         user_id: str,
     ) -> SnapshotResponse:
         """Create a snapshot from current session"""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         snapshot_id = str(uuid.uuid4())
 
         try:
@@ -673,50 +1022,17 @@ class ClipProcessingService(IClipProcessingService):
 
             # Generate output path
             filename = f"{snapshot_id}.{request.format}"
-            output_path = self.clips_storage_path / "snapshots" / filename
+            out_str = str(self.clips_storage_path / "snapshots" / filename)
 
             # Prepare FFmpeg command
             quality_settings = self._get_quality_settings(request.quality, is_snapshot=True)
 
-            input_stream = ffmpeg.input(source_path, ss=timestamp_seconds)
-            output_stream = ffmpeg.output(
-                input_stream, str(output_path), vframes=1, **quality_settings
-            )
+            threads = _ffmpeg_threads(settings.max_concurrent_clips)
 
             # Execute FFmpeg with retry logic
-            def run_ffmpeg() -> None:
-                try:
-                    ffmpeg.run(
-                        output_stream,
-                        capture_stdout=True,
-                        capture_stderr=True,
-                        overwrite_output=True,
-                    )
-                except ffmpeg.Error as e:
-                    stderr = e.stderr.decode("utf-8") if e.stderr else "No error details"
-                    raise MediaProcessingError(f"FFmpeg error: {stderr}")
-
-            loop = asyncio.get_event_loop()
-            await retry_async(lambda: loop.run_in_executor(None, run_ffmpeg), strategy=FFMPEG_RETRY)
-
-            # Add delay and retry to ensure file is written to disk
-            file_exists = False
-            max_retries = 10
-            for retry_count in range(max_retries):
-                await asyncio.sleep(0.05)  # Wait 50ms between checks
-                if output_path.exists():
-                    file_exists = True
-                    break
-
-            # Get file info
-            try:
-                if not file_exists:
-                    raise StorageError(
-                        f"Output file does not exist after FFmpeg with {max_retries} retries: {output_path}"
-                    )
-                file_size = output_path.stat().st_size
-            except OSError as e:
-                raise StorageError(f"Failed to get file size: {e}")
+            file_size = await self._capture_frame(
+                source_path, timestamp_seconds, out_str, request.format, quality_settings, threads
+            )
 
             download_url = f"/api/v1/storage/snapshot/{snapshot_id}"
 
@@ -727,7 +1043,7 @@ class ClipProcessingService(IClipProcessingService):
                     {
                         "id": snapshot_id,
                         "user_id": user_id,
-                        "file_path": str(output_path),
+                        "file_path": out_str,
                         "file_size": file_size,
                         "timestamp": request.timestamp,
                         "status": "completed",
@@ -735,7 +1051,7 @@ class ClipProcessingService(IClipProcessingService):
                 )
 
             # Log performance
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             performance_logger.log_media_processing_duration(
                 "snapshot_creation", file_size / (1024 * 1024), processing_time
             )
@@ -748,7 +1064,7 @@ class ClipProcessingService(IClipProcessingService):
             return SnapshotResponse(
                 snapshot_id=snapshot_id,
                 status="completed",
-                file_path=str(output_path),
+                file_path=out_str,
                 download_url=download_url,
                 file_size=file_size,
                 timestamp=request.timestamp,
@@ -770,7 +1086,7 @@ class ClipProcessingService(IClipProcessingService):
         user_id: str,
     ) -> MultiFrameResponse:
         """Create multiple frames around a center timestamp"""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         try:
             self.logger.info(
@@ -782,27 +1098,7 @@ class ClipProcessingService(IClipProcessingService):
             source_path = await self._get_source_path(session, plex_token)
 
             # Get video frame rate
-            try:
-                probe = ffmpeg.probe(source_path)
-                video_stream = next(
-                    (s for s in probe["streams"] if s["codec_type"] == "video"), None
-                )
-                if not video_stream:
-                    raise MediaProcessingError("No video stream found in source file")
-
-                fps_str = video_stream.get("r_frame_rate", "30/1")
-                if "/" in fps_str:
-                    num, den = fps_str.split("/")
-                    fps = float(num) / float(den)
-                else:
-                    fps = float(fps_str)
-
-                if fps <= 0:
-                    fps = 30.0
-
-            except Exception as e:
-                self.logger.warning(f"Could not determine frame rate, using default 30fps: {e}")
-                fps = 30.0
+            fps = await self._get_frame_rate(session, source_path)
 
             # Calculate frame numbers
             center_timestamp_seconds = TimeUtils.parse_time_to_seconds(request.center_timestamp)
@@ -817,95 +1113,62 @@ class ClipProcessingService(IClipProcessingService):
             frames = []
             quality_settings = self._get_quality_settings(request.quality, is_snapshot=True)
 
-            # Extract each frame
             self.logger.info(
                 f"Attempting to extract {len(frame_numbers)} frames",
                 extra={"user_id": user_id},
             )
-            for frame_number in frame_numbers:
-                frame_id = str(uuid.uuid4())
-
-                timestamp = frame_number / fps
-                filename = f"frame_{frame_id}.{request.format}"
-                output_path = self.clips_storage_path / "snapshots" / filename
-
+            extracted: List[Tuple[int, str, Path, int]] = []
+            if av is not None:
+                # Decode the whole run in-process with a single demuxer/decoder open
                 try:
-                    input_stream = ffmpeg.input(source_path, ss=timestamp)
-                    output_stream = ffmpeg.output(
-                        input_stream, str(output_path), vframes=1, **quality_settings
-                    )
-
-                    def run_ffmpeg() -> None:
-                        try:
-                            ffmpeg.run(
-                                output_stream,
-                                capture_stdout=True,
-                                capture_stderr=True,
-                                overwrite_output=True,
-                            )
-                        except ffmpeg.Error as e:
-                            stderr = e.stderr.decode("utf-8") if e.stderr else "No error details"
-                            raise MediaProcessingError(f"FFmpeg error: {stderr}")
-
                     loop = asyncio.get_event_loop()
-                    await retry_async(
-                        lambda: loop.run_in_executor(None, run_ffmpeg),
-                        strategy=FFMPEG_RETRY,
-                    )
-
-                    # Add delay and retry to ensure file is written to disk
-                    file_exists = False
-                    max_retries = 10
-                    for retry_count in range(max_retries):
-                        await asyncio.sleep(0.05)  # Wait 50ms between checks
-                        if output_path.exists():
-                            file_exists = True
-                            break
-
-                    if not file_exists:
-                        self.logger.warning(
-                            f"Output file does not exist after FFmpeg with {max_retries} retries: {output_path}"
+                    async with _FRAME_SLOTS:
+                        extracted = await loop.run_in_executor(
+                            _FFMPEG_EXECUTOR,
+                            _decode_frames_pyav,
+                            source_path,
+                            frame_numbers,
+                            fps,
+                            _PYAV_JPEG_QUALITY.get(request.quality, _PYAV_JPEG_QUALITY["medium"]),
+                            self.clips_storage_path / "snapshots",
+                            request.format,
                         )
-                        continue
-
-                    file_size = output_path.stat().st_size
-                    download_url = f"/api/v1/storage/snapshot/{frame_id}"
-
-                    frames.append(
-                        FrameInfo(
-                            frame_id=frame_id,
-                            timestamp=TimeUtils.seconds_to_time_string(timestamp),
-                            download_url=download_url,
-                            file_path=str(output_path),
-                            file_size=file_size,
-                        )
-                    )
+                except Exception as e:
+                    self.logger.warning(f"PyAV frame decode failed, falling back to FFmpeg: {e}")
 
-                    self.logger.debug(
-                        f"Successfully extracted frame {frame_number} at timestamp {timestamp}",
-                        extra={"user_id": user_id, "frame_id": frame_id},
-                    )
+            if not extracted:
+                extracted = await self._extract_frames_ffmpeg(
+                    source_path, frame_numbers, fps, quality_settings, request.format
+                )
 
-                    # Store in database
-                    with get_db_session() as db:
-                        snapshot_repo = SnapshotRepository(db)
-                        snapshot_repo.create(
-                            {
-                                "id": frame_id,
-                                "user_id": user_id,
-                                "file_path": str(output_path),
-                                "file_size": file_size,
-                                "timestamp": TimeUtils.seconds_to_time_string(timestamp),
-                                "status": "completed",
-                            }
-                        )
+            snapshot_rows = []
+            for frame_number, frame_id, output_path, file_size in extracted:
+                timestamp = TimeUtils.seconds_to_time_string(frame_number / fps)
+                file_path = str(output_path)
+                frames.append(
+                    FrameInfo(
+                        frame_id=frame_id,
+                        timestamp=timestamp,
+                        download_url=f"/api/v1/storage/snapshot/{frame_id}",
+                        file_path=file_path,
+                        file_size=file_size,
+                    )
+                )
+                snapshot_rows.append(
+                    {
+                        "id": frame_id,
+                        "user_id": user_id,
+                        "file_path": file_path,
+                        "file_size": file_size,
+                        "timestamp": timestamp,
+                        "status": "completed",
+                    }
+                )
 
-                except (ffmpeg.Error, MediaProcessingError, OSError) as e:
-                    self.logger.warning(f"Error extracting frame {frame_number}: {e}")
-                    continue
-                except Exception as e:
-                    self.logger.error(f"Unexpected error extracting frame {frame_number}: {e}")
-                    continue
+            # Store all frames in one transaction
+            if snapshot_rows:
+                with get_db_session() as db:
+                    SnapshotRepository(db).bulk_create(snapshot_rows)
 
             if not frames:
                 error_msg = f"Failed to extract any frames from {len(frame_numbers)} attempted frames. Source: {source_path}, Center timestamp: {request.center_timestamp}"
@@ -913,7 +1176,7 @@ class ClipProcessingService(IClipProcessingService):
                 raise MediaProcessingError(error_msg)
 
             # Log performance
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             total_size = sum(frame.file_size for frame in frames) / (1024 * 1024)
             performance_logger.log_media_processing_duration(
                 "multi_frame_creation", total_size, processing_time
@@ -948,11 +1211,126 @@ class ClipProcessingService(IClipProcessingService):
             )
             raise ClipProcessingError(f"Multi-frame creation failed: {str(e)}")
 
+    async def _get_frame_rate(self, session: SessionInfo, source_path: str) -> float:
+        """Get the source frame rate, only probing when Plex didn't report one"""
+        if session.original_file_info and session.original_file_info.frame_rate:
+            return session.original_file_info.frame_rate
+
+        try:
+            summary = await _get_stream_summary(source_path)
+            if not summary.video_codec:
+                raise MediaProcessingError("No video stream found in source file")
+
+            fps_str = summary.frame_rate or "30/1"
+            if "/" in fps_str:
+                num, den = fps_str.split("/")
+                fps = float(num) / float(den)
+            else:
+                fps = float(fps_str)
+
+            if fps <= 0:
+                fps = 30.0
+
+        except Exception as e:
+            self.logger.warning(f"Could not determine frame rate, using default 30fps: {e}")
+            fps = 30.0
+
+        # Remember it for later requests against the same session
+        if session.original_file_info:
+            session.original_file_info.frame_rate = fps
+
+        return fps
+
+    async def _extract_frames_ffmpeg(
+        self,
+        source_path: str,
+        frame_numbers: List[int],
+        fps: float,
+        quality_settings: Mapping[str, Any],
+        image_format: str,
+    ) -> List[Tuple[int, str, Path, int]]:
+        """Extract contiguous runs of frames, one FFmpeg invocation per run"""
+        run_length = max(_MIN_FRAMES_PER_RUN, -(-len(frame_numbers) // _FRAME_WORKERS))
+        runs = [frame_numbers[i : i + run_length] for i in range(0, len(frame_numbers), run_length)]
+        results = await asyncio.gather(
+            *(
+                self._extract_frame_run(source_path, run, fps, quality_settings, image_format)
+                for run in runs
+            ),
+            return_exceptions=True,
+        )
+
+        extracted = []
+        for run, result in zip(runs, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Error extracting frames {run}: {result}")
+                continue
+            extracted.extend(result)
+        return extracted
+
+    async def _extract_frame_run(
+        self,
+        source_path: str,
+        frame_numbers: List[int],
+        fps: float,
+        quality_settings: Mapping[str, Any],
+        image_format: str,
+    ) -> List[Tuple[int, str, Path, int]]:
+        """
+        Extract a contiguous run of frames with one FFmpeg invocation
+
+        Returns (frame_number, frame_id, output_path, file_size) for each frame written.
+        """
+        snapshots_dir = self.clips_storage_path / "snapshots"
+        batch_id = uuid.uuid4().hex
+
+        # Seek once to the first frame; since the run is contiguous the next
+        # len(frame_numbers) decoded frames are exactly the requested ones
+        # The argv is built directly rather than through an ffmpeg-python graph, since only
+        # the seek point, frame count and output pattern vary between runs
+        threads = str(_ffmpeg_threads(_FRAME_WORKERS))
+        args = [
+            "ffmpeg",
+            "-threads",
+            threads,
+            "-ss",
+            str(frame_numbers[0] / fps),
+            "-i",
+            source_path,
+            "-vframes",
+            str(len(frame_numbers)),
+            "-vsync",
+            "0",
+            "-threads",
+            threads,
+            *_output_flags(quality_settings),
+            "-y",
+            str(snapshots_dir / f"batch_{batch_id}_%04d.{image_format}"),
+        ]
+        async with _FRAME_SLOTS:
+            await retry_async(_run_ffmpeg_args, args, strategy=FFMPEG_RETRY)
+
+        # The image2 muxer numbers its outputs from 1
+        extracted = []
+        for index, frame_number in enumerate(frame_numbers, start=1):
+            batch_path = snapshots_dir / f"batch_{batch_id}_{index:04d}.{image_format}"
+            frame_id = str(uuid.uuid4())
+            output_path = snapshots_dir / f"frame_{frame_id}.{image_format}"
+            try:
+                batch_path.rename(output_path)
+                file_size = output_path.stat().st_size
+            except OSError:
+                self.logger.warning(f"FFmpeg did not produce frame {frame_number}: {batch_path}")
+                continue
+            extracted.append((frame_number, frame_id, output_path, file_size))
+
+        return extracted
+
     async def edit_clip(
         self, source_clip_id: str, request: EditRequest, user_id: str
     ) -> EditResponse:
         """Edit an existing clip by trimming it"""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         edit_id = str(uuid.uuid4())
 
         try:
@@ -978,6 +1356,7 @@ class ClipProcessingService(IClipProcessingService):
                     raise FileNotFoundError("Source clip not found or access denied")
 
                 source_clip_path = str(clip.file_path)
+                stored_streams = (clip.video_codec, clip.audio_codec, clip.container_format)
 
             if not os.path.exists(source_clip_path):
                 raise FileNotFoundError(f"Source clip file not found: {source_clip_path}")
@@ -989,105 +1368,55 @@ class ClipProcessingService(IClipProcessingService):
             # Generate output path
             filename = f"{edit_id}.{request.format}"
             output_path = self.clips_storage_path / "edited" / filename
+            out_str = str(output_path)
 
-            # Prepare FFmpeg command
-            input_stream = ffmpeg.input(source_clip_path, ss=start_seconds, t=duration)
-
-            if self._can_copy_streams(source_clip_path, request.format):
-                output_args = {
-                    "c": "copy",
-                    "map_metadata": "-1",
-                    "avoid_negative_ts": "make_zero",
-                }
+            # Prepare FFmpeg command, using the stream info stored with the clip when present
+            video_codec, audio_codec, container_format = stored_streams
+            if container_format:
+                can_copy = container_format == request.format and self._streams_copyable(
+                    video_codec, audio_codec, request.format
+                )
             else:
-                quality_settings = self._get_quality_settings(request.quality)
-                output_args = {
-                    "vcodec": "libx264",
-                    "acodec": "aac",
-                    "pix_fmt": "yuv420p",
-                    "map_metadata": "-1",
-                    **quality_settings,
-                }
-
-            # Execute FFmpeg with retry logic
-            output_stream = ffmpeg.output(input_stream, str(output_path), **output_args)
+                can_copy = await self._can_copy_streams(source_clip_path, request.format)
 
-            def run_ffmpeg() -> None:
-                try:
-                    ffmpeg.run(
-                        output_stream,
-                        capture_stdout=True,
-                        capture_stderr=True,
-                        overwrite_output=True,
-                    )
-                except ffmpeg.Error as e:
-                    stderr = e.stderr.decode("utf-8") if e.stderr else "No error details"
-                    raise MediaProcessingError(f"FFmpeg error: {stderr}")
-
-            loop = asyncio.get_event_loop()
-            await retry_async(lambda: loop.run_in_executor(None, run_ffmpeg), strategy=FFMPEG_RETRY)
+            hw_encoder = None if can_copy else self._get_hw_encoder()
 
-            # Wait for file to be fully written with retries
-            max_retries = 30
-            last_size = 0
-            stable_checks = 0
-
-            for i in range(max_retries):
-                await asyncio.sleep(0.2)  # 200ms wait each time
-
-                if output_path.exists() or output_path.absolute().exists():
-                    try:
-                        current_size = (
-                            output_path.stat().st_size
-                            if output_path.exists()
-                            else output_path.absolute().stat().st_size
-                        )
-
-                        # Check if file size is stable (not being written to)
-                        if current_size > 0 and current_size == last_size:
-                            stable_checks += 1
-                            if stable_checks >= 2:  # File size stable for 2 checks
-                                self.logger.info(
-                                    f"File ready after {i+1} retries, size: {current_size}"
-                                )
-                                break
-                        else:
-                            stable_checks = 0
+            def build_output_stream(encoder: Optional[str]) -> Any:
+                input_args: Mapping[str, Any] = {}
+                output_args: Mapping[str, Any]
+                if can_copy:
+                    # Stream copy does no decoding, one thread is plenty
+                    threads = 1
+                    output_args = _STREAM_COPY_ARGS
+                else:
+                    threads = _ffmpeg_threads(settings.max_concurrent_clips)
+                    if encoder:
+                        input_args, output_args = self._get_hw_encode_args(encoder, request.quality)
+                    else:
+                        output_args = _X264_ARGS.get(request.quality, _X264_ARGS["medium"])
 
-                        last_size = current_size
-                        self.logger.debug(
-                            f"File size: {current_size}, stable checks: {stable_checks}"
-                        )
-                    except OSError:
-                        # File might be locked, continue waiting
-                        pass
+                input_stream = ffmpeg.input(
+                    source_clip_path, ss=start_seconds, t=duration, threads=threads, **input_args
+                )
+                return ffmpeg.output(input_stream, out_str, threads=threads, **output_args)
 
-                self.logger.debug(f"File not ready, retry {i+1}/{max_retries}: {output_path}")
+            # Execute FFmpeg with retry logic, falling back to libx264 if the GPU encode fails
+            try:
+                await self._run_ffmpeg(build_output_stream(hw_encoder))
+            except MediaProcessingError as e:
+                if not hw_encoder:
+                    raise
+                self.logger.warning(
+                    f"Hardware encode with {hw_encoder} failed, falling back to libx264: {e}"
+                )
+                await self._run_ffmpeg(build_output_stream(None))
 
-            # Get file info
+            # FFmpeg has exited (copy or re-encode), so the file is already complete
             try:
-                self.logger.info(f"Checking file size for: {output_path}")
-                self.logger.info(f"File exists: {output_path.exists()}")
-                # Try both relative and absolute paths
-                if output_path.exists():
-                    file_size = output_path.stat().st_size
-                    self.logger.info(f"File size: {file_size}")
-                elif output_path.absolute().exists():
-                    self.logger.warning(f"File found with absolute path: {output_path.absolute()}")
-                    file_size = output_path.absolute().stat().st_size
-                    self.logger.info(f"File size: {file_size}")
-                else:
-                    # Try with os.path.exists as last resort
-                    str_path = str(output_path)
-                    if os.path.exists(str_path):
-                        self.logger.warning(f"File found with os.path.exists: {str_path}")
-                        file_size = os.path.getsize(str_path)
-                        self.logger.info(f"File size: {file_size}")
-                    else:
-                        self.logger.error(f"File does not exist after FFmpeg: {output_path}")
-                        self.logger.error(f"Absolute path: {output_path.absolute()}")
-                        self.logger.error(f"String path: {str_path}")
-                        raise StorageError(f"Output file does not exist: {output_path}")
+                file_size = os.stat(out_str).st_size
+            except builtins.FileNotFoundError:
+                self.logger.error(f"File does not exist after FFmpeg: {output_path}")
+                raise StorageError(f"Output file does not exist: {output_path}")
             except OSError as e:
                 self.logger.error(f"OSError getting file size for {output_path}: {e}")
                 raise StorageError(f"Failed to get file size: {e}")
@@ -1114,7 +1443,7 @@ class ClipProcessingService(IClipProcessingService):
                         "id": edit_id,
                         "user_id": user_id,
                         "source_clip_id": source_clip_id,
-                        "file_path": str(output_path),
+                        "file_path": out_str,
                         "file_size": file_size,
                         "duration": duration,
                         "start_time": request.start_time,
@@ -1126,7 +1455,7 @@ class ClipProcessingService(IClipProcessingService):
                 )
 
             # Log performance
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             performance_logger.log_media_processing_duration(
                 "clip_edit", file_size / (1024 * 1024), processing_time
             )
@@ -1140,7 +1469,7 @@ class ClipProcessingService(IClipProcessingService):
                 edit_id=edit_id,
                 source_clip_id=source_clip_id,
                 status="completed",
-                file_path=str(output_path),
+                file_path=out_str,
                 download_url=download_url,
                 file_size=file_size,
                 duration=duration,
@@ -1169,136 +1498,50 @@ class ClipProcessingService(IClipProcessingService):
                 raise ValidationError("Plex token is required for preview frame generation")
             source_path = await self._get_source_path(session, plex_token)
 
-            frames = {}
             quality_settings = self._get_quality_settings("medium", is_snapshot=True)
+            threads = _ffmpeg_threads(settings.max_concurrent_clips)
 
-            # Generate start frame if requested
-            if start_time:
-                start_seconds = TimeUtils.parse_time_to_seconds(start_time)
-                start_frame_id = str(uuid.uuid4())
-                filename = f"preview_start_{start_frame_id}.jpg"
-                output_path = self.clips_storage_path / "snapshots" / filename
-
-                input_stream = ffmpeg.input(source_path, ss=start_seconds)
-                output_stream = ffmpeg.output(
-                    input_stream, str(output_path), vframes=1, **quality_settings
+            # Start and end frames are independent FFmpeg runs, so generate them concurrently
+            requested = [
+                (label, timestamp)
+                for label, timestamp in (("start", start_time), ("end", end_time))
+                if timestamp
+            ]
+            results = await asyncio.gather(
+                *(
+                    self._generate_preview_frame(
+                        source_path, label, timestamp, quality_settings, threads
+                    )
+                    for label, timestamp in requested
                 )
+            )
 
-                def run_ffmpeg() -> None:
-                    try:
-                        ffmpeg.run(output_stream, capture_stdout=True, capture_stderr=True)
-                    except ffmpeg.Error as e:
-                        stderr = e.stderr.decode("utf-8") if e.stderr else "No error details"
-                        raise MediaProcessingError(f"FFmpeg error: {stderr}")
-
-                async def run_ffmpeg_and_verify() -> None:
-                    """Run FFmpeg and verify the output file was created"""
-                    # Run FFmpeg
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, run_ffmpeg)
-
-                    # Wait a moment for filesystem sync
-                    await asyncio.sleep(0.1)
-
-                    # Verify file was created
-                    if not output_path.exists():
-                        raise StorageError(f"Preview start frame was not created: {output_path}")
-
-                await retry_async(
-                    run_ffmpeg_and_verify,
-                    strategy=FFMPEG_RETRY,
+            frames = {}
+            preview_rows: List[Dict[str, Any]] = []
+            for (label, timestamp), (frame_id, file_path, file_size) in zip(requested, results):
+                # Record preview frame for cleanup; stored together below
+                preview_rows.append(
+                    {
+                        "id": frame_id,
+                        "user_id": user_id,
+                        "file_path": file_path,
+                        "file_size": file_size,
+                        "timestamp": timestamp,
+                        "status": "completed",
+                    }
                 )
 
-                try:
-                    file_size = output_path.stat().st_size
-                except OSError as e:
-                    raise StorageError(f"Failed to get file size: {e}")
-
-                # Store preview frame in database temporarily for cleanup
-                if user_id:
-                    with get_db_session() as db:
-                        snapshot_repo = SnapshotRepository(db)
-                        snapshot_repo.create(
-                            {
-                                "id": start_frame_id,
-                                "user_id": user_id,
-                                "file_path": str(output_path),
-                                "file_size": file_size,
-                                "timestamp": start_time,
-                                "status": "completed",
-                            }
-                        )
-
-                frames["start_frame"] = {
-                    "frame_id": start_frame_id,
-                    "timestamp": start_time,
-                    "download_url": f"/api/v1/storage/snapshot/{start_frame_id}",
-                    "file_path": str(output_path),
+                frames[f"{label}_frame"] = {
+                    "frame_id": frame_id,
+                    "timestamp": timestamp,
+                    "download_url": f"/api/v1/storage/snapshot/{frame_id}",
+                    "file_path": file_path,
                 }
 
-            # Generate end frame if requested
-            if end_time:
-                end_seconds = TimeUtils.parse_time_to_seconds(end_time)
-                end_frame_id = str(uuid.uuid4())
-                filename = f"preview_end_{end_frame_id}.jpg"
-                output_path = self.clips_storage_path / "snapshots" / filename
-
-                input_stream = ffmpeg.input(source_path, ss=end_seconds)
-                output_stream = ffmpeg.output(
-                    input_stream, str(output_path), vframes=1, **quality_settings
-                )
-
-                def run_ffmpeg_end() -> None:
-                    try:
-                        ffmpeg.run(output_stream, capture_stdout=True, capture_stderr=True)
-                    except ffmpeg.Error as e:
-                        stderr = e.stderr.decode("utf-8") if e.stderr else "No error details"
-                        raise MediaProcessingError(f"FFmpeg error: {stderr}")
-
-                async def run_ffmpeg_and_verify_end() -> None:
-                    """Run FFmpeg and verify the output file was created"""
-                    # Run FFmpeg
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, run_ffmpeg_end)
-
-                    # Wait a moment for filesystem sync
-                    await asyncio.sleep(0.1)
-
-                    # Verify file was created
-                    if not output_path.exists():
-                        raise StorageError(f"Preview end frame was not created: {output_path}")
-
-                await retry_async(
-                    run_ffmpeg_and_verify_end,
-                    strategy=FFMPEG_RETRY,
-                )
-
-                try:
-                    file_size = output_path.stat().st_size
-                except OSError as e:
-                    raise StorageError(f"Failed to get file size: {e}")
-
-                # Store preview frame in database temporarily for cleanup
-                if user_id:
-                    with get_db_session() as db:
-                        snapshot_repo = SnapshotRepository(db)
-                        snapshot_repo.create(
-                            {
-                                "id": end_frame_id,
-                                "user_id": user_id,
-                                "file_path": str(output_path),
-                                "file_size": file_size,
-                                "timestamp": end_time,
-                                "status": "completed",
-                            }
-                        )
-
-                frames["end_frame"] = {
-                    "frame_id": end_frame_id,
-                    "timestamp": end_time,
-                    "download_url": f"/api/v1/storage/snapshot/{end_frame_id}",
-                    "file_path": str(output_path),
-                }
+            # Store preview frames in database temporarily for cleanup
+            if user_id and preview_rows:
+                with get_db_session() as db:
+                    SnapshotRepository(db).bulk_create(preview_rows)
 
             return {"status": "completed", "frames": frames}
 
@@ -1309,6 +1552,61 @@ class ClipProcessingService(IClipProcessingService):
                 "error_message": f"Preview frame generation failed: {str(e)}",
             }
 
+    async def _generate_preview_frame(
+        self,
+        source_path: str,
+        label: str,
+        timestamp: str,
+        quality_settings: Mapping[str, Any],
+        threads: int,
+    ) -> Tuple[str, str, int]:
+        """Extract a single preview frame, returning (frame_id, file_path, file_size)"""
+        seconds = TimeUtils.parse_time_to_seconds(timestamp)
+        frame_id = str(uuid.uuid4())
+        filename = f"preview_{label}_{frame_id}.jpg"
+        out_str = str(self.clips_storage_path / "snapshots" / filename)
+
+        file_size = await self._capture_frame(
+            source_path, seconds, out_str, "jpg", quality_settings, threads
+        )
+        return frame_id, out_str, file_size
+
+    async def _capture_frame(
+        self,
+        source_path: str,
+        seconds: float,
+        out_str: str,
+        image_format: str,
+        quality_settings: Mapping[str, Any],
+        threads: int,
+    ) -> int:
+        """Grab one frame through FFmpeg's stdout and write it out once, returning its size"""
+        vcodec = _IMAGE_ENCODERS.get(image_format.lower())
+        if vcodec is None:
+            raise ValidationError(f"Unsupported image format: {image_format}")
+
+        input_stream = ffmpeg.input(source_path, ss=seconds, threads=threads)
+        output_stream = ffmpeg.output(
+            input_stream,
+            "pipe:",
+            format="image2pipe",
+            vcodec=vcodec,
+            vframes=1,
+            threads=threads,
+            **quality_settings,
+        )
+
+        data = await self._run_ffmpeg(output_stream)
+        if not data:
+            raise StorageError(f"FFmpeg produced no image data for {out_str}")
+
+        # The size is known from the buffer, so no stat is needed after writing
+        try:
+            await asyncio.to_thread(Path(out_str).write_bytes, data)
+        except OSError as e:
+            raise StorageError(f"Failed to write image {out_str}: {e}")
+        return len(data)
+
     async def cleanup_snapshot_frames(self, frame_ids: List[str], user_id: str) -> Dict[str, Any]:
         """Clean up snapshot frames by frame IDs"""
         try:
@@ -1317,38 +1615,34 @@ class ClipProcessingService(IClipProcessingService):
                 extra={"user_id": user_id, "frame_count": len(frame_ids)},
             )
 
-            cleaned_count = 0
             errors = []
 
+            # One SELECT for every requested frame
             with get_db_session() as db:
-                snapshot_repo = SnapshotRepository(db)
+                snapshots = SnapshotRepository(db).get_many(frame_ids, user_id)
+                file_paths = {str(snapshot.id): snapshot.file_path for snapshot in snapshots}
 
-                for frame_id in frame_ids:
-                    try:
-                        # Get snapshot from database
-                        snapshot = snapshot_repo.get_by_id(frame_id, user_id)
-
-                        if snapshot:
-                            # Delete the file if it exists
-                            if snapshot.file_path and os.path.exists(snapshot.file_path):
-                                os.remove(snapshot.file_path)
-                                self.logger.debug(f"Deleted snapshot file: {snapshot.file_path}")
-
-                            # Remove from database
-                            snapshot_repo.delete(frame_id, user_id)
-                            cleaned_count += 1
+            for frame_id in frame_ids:
+                if frame_id not in file_paths:
+                    self.logger.warning(f"Snapshot frame {frame_id} not found or access denied")
+                    errors.append(f"Frame {frame_id} not found or access denied")
 
-                            self.logger.debug(f"Cleaned up snapshot frame {frame_id}")
-                        else:
-                            self.logger.warning(
-                                f"Snapshot frame {frame_id} not found or access denied"
-                            )
-                            errors.append(f"Frame {frame_id} not found or access denied")
+            # Remove the files off the event loop; already-missing files count as removed
+            failures = await asyncio.to_thread(
+                _unlink_paths, [path for path in file_paths.values() if path]
+            )
+            removed_ids = []
+            for frame_id, path in file_paths.items():
+                if path in failures:
+                    error_msg = f"Failed to cleanup frame {frame_id}: {failures[path]}"
+                    self.logger.error(error_msg)
+                    errors.append(error_msg)
+                else:
+                    removed_ids.append(frame_id)
 
-                    except Exception as e:
-                        error_msg = f"Failed to cleanup frame {frame_id}: {str(e)}"
-                        self.logger.error(error_msg)
-                        errors.append(error_msg)
+            # One DELETE and commit for every frame whose file is gone
+            with get_db_session() as db:
+                cleaned_count = SnapshotRepository(db).delete_many(removed_ids, user_id)
 
             self.logger.info(
                 f"Cleaned up {cleaned_count} snapshot frames for user {user_id}",
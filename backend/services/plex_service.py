@@ -3,13 +3,20 @@ Plex Integration Service - Service layer for Plex operations
 Implements IPlexService interface with proper error handling and logging
 """
 
-import json
+import asyncio
+import functools
+import hashlib
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Type
 
 import httpx
+import ijson
+import orjson
 from core.config import settings
 from core.exceptions import (
+    ClipForgeException,
     ExternalServiceError,
     PlexAuthenticationError,
     PlexConnectionError,
@@ -17,6 +24,7 @@ from core.exceptions import (
 )
 from core.logging import get_logger, performance_logger
 from core.resilience import with_plex_retry
+from defusedxml import DefusedXmlException
 from defusedxml import ElementTree as ET
 from domain.interfaces import IPlexService
 from domain.schemas import (
@@ -32,6 +40,95 @@ from domain.schemas import (
     PlexUser,
     SessionInfo,
 )
+from services.cache_service import get_cache
+
+PLEX_TIMEOUT = 30.0
+PLEX_KEEPALIVE = 30.0
+PLEX_CLIENT_ID = "clipforge-v1"
+
+# Sent with every Plex request; only X-Plex-Token varies per call
+PLEX_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "Accept": "application/json",
+        "X-Plex-Product": "clipforge-v1",
+        "X-Plex-Version": "1.0.0",
+        "X-Plex-Client-Identifier": PLEX_CLIENT_ID,
+        "X-Plex-Platform": "Web",
+        "X-Plex-Platform-Version": "1.0",
+        "X-Plex-Model": "Plex OAuth",
+        "X-Plex-Device": "Browser",
+        "X-Plex-Device-Name": "clipforge-v1",
+        "X-Plex-Language": "en",
+        "Content-Type": "application/json",
+    }
+)
+
+_NO_HEADERS: Mapping[str, str] = MappingProxyType({})
+# Shared default for absent Plex child arrays, so a miss doesn't allocate a fresh list
+_NO_ITEMS: Tuple[Any, ...] = ()
+
+# PlexService is created per request, so the connection pool lives at module level to keep
+# TCP/TLS connections to plex.tv and each server alive across requests
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared Plex HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # Pools are per origin: HTTPS servers multiplex concurrent /status/sessions and
+        # /identity calls over one HTTP/2 connection, plain-HTTP LAN servers fall back to
+        # HTTP/1.1 keep-alive. Idle connections outlive a poll interval so polling reuses them.
+        _http_client = httpx.AsyncClient(
+            timeout=PLEX_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=20, keepalive_expiry=PLEX_KEEPALIVE
+            ),
+            http2=True,
+            headers=PLEX_HEADERS,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Plex HTTP client and its pooled connections"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@functools.lru_cache(maxsize=1024)
+def _epoch_to_datetime(seconds: float) -> datetime:
+    """Convert a Plex epoch timestamp, cached since polls keep reporting the same values"""
+    return datetime.fromtimestamp(seconds)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp_text(value: str) -> datetime:
+    """Parse a Plex timestamp string (epoch seconds or ISO 8601), cached per raw value"""
+    try:
+        return _epoch_to_datetime(float(value))
+    except ValueError:
+        # Python 3.11+ reads a trailing "Z" itself and reuses timezone.utc for zero offsets
+        return datetime.fromisoformat(value)
+
+
+def _xml_element_to_dict(element: Any) -> Dict[str, Any]:
+    """Convert a Plex XML element to its JSON shape: attributes plus child lists by tag"""
+    data: Dict[str, Any] = dict(element.attrib)
+    for child in element:
+        data.setdefault(child.tag, []).append(_xml_element_to_dict(child))
+    return data
+
+
+def _decode_plex_body(response: httpx.Response) -> Any:
+    """Decode a Plex response body, accepting XML from endpoints that ignore Accept: JSON"""
+    if "xml" in response.headers.get("content-type", ""):
+        # defusedxml refuses entity expansion and external DTDs
+        root = ET.fromstring(response.content)
+        return {root.tag: _xml_element_to_dict(root)}
+    return orjson.loads(response.content)
 
 
 class PlexService(IPlexService):
@@ -39,192 +136,142 @@ class PlexService(IPlexService):
 
     def __init__(self) -> None:
         self.base_url = "https://plex.tv"
-        self.timeout = 30.0
-        self.client_id = "clipforge-v1"
+        self.timeout = PLEX_TIMEOUT
+        self.client_id = PLEX_CLIENT_ID
         self.logger = get_logger("plex_service")
 
-    def _get_headers(self, token: Optional[str] = None) -> Dict[str, str]:
-        """Generate Plex API headers"""
-        headers = {
-            "Accept": "application/json",
-            "X-Plex-Product": "clipforge-v1",
-            "X-Plex-Version": "1.0.0",
-            "X-Plex-Client-Identifier": self.client_id,
-            "X-Plex-Platform": "Web",
-            "X-Plex-Platform-Version": "1.0",
-            "X-Plex-Model": "Plex OAuth",
-            "X-Plex-Device": "Browser",
-            "X-Plex-Device-Name": "clipforge-v1",
-            "X-Plex-Language": "en",
-            "Content-Type": "application/json",
-        }
-
-        if token:
-            headers["X-Plex-Token"] = token
-
-        return headers
-
-    @with_plex_retry()
-    async def create_pin(self) -> Optional[Dict[str, Any]]:
-        """Create a new PIN for Plex OAuth authentication"""
-        start_time = datetime.now()
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for all Plex requests"""
+        return get_http_client()
+
+    def _get_headers(self, token: Optional[str] = None) -> Mapping[str, str]:
+        """Generate per-request Plex API headers (the client already sends PLEX_HEADERS)"""
+        return {"X-Plex-Token": token} if token else _NO_HEADERS
+
+    async def _request_json(
+        self,
+        method: str,
+        url: str,
+        action: str,
+        metric: str,
+        token: Optional[str] = None,
+        expect: int = 200,
+        parse_error: Type[ClipForgeException] = PlexConnectionError,
+    ) -> Optional[Any]:
+        """Send a Plex request and decode its JSON body, mapping failures to service errors
+
+        Returns None, after logging, when Plex answers with a status other than ``expect``.
+        An undecodable body raises ``parse_error``.
+        """
+        start_ns = time.perf_counter_ns()
 
         try:
-            self.logger.info("Creating Plex authentication PIN")
+            response = await self._client.request(method, url, headers=self._get_headers(token))
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v2/pins?strong=true",
-                    headers=self._get_headers(),
-                )
+            # Log performance
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000
+            performance_logger.log_request_duration(metric, method, duration, response.status_code)
 
-                if response.status_code == 201:
-                    data = response.json()
-                    pin_data = {"id": data["id"], "code": data["code"]}
+            if response.status_code != expect:
+                self.logger.warning(f"Failed {action}: {response.status_code}")
+                return None
 
-                    # Log performance
-                    duration = (datetime.now() - start_time).total_seconds() * 1000
-                    performance_logger.log_request_duration(
-                        "plex_create_pin", "POST", duration, response.status_code
-                    )
-
-                    self.logger.info(f"Successfully created Plex PIN: {pin_data['id']}")
-                    return pin_data
-                else:
-                    self.logger.warning(f"Failed to create Plex PIN: {response.status_code}")
+            # Most endpoints honour Accept: application/json, but some plex.tv ones
+            # (/users/account, /pms/servers) may still answer in XML
+            return _decode_plex_body(response)
 
         except httpx.TimeoutException:
-            self.logger.error("Timeout creating Plex PIN")
-            raise PlexConnectionError("Plex service timeout during PIN creation")
+            self.logger.error(f"Timeout {action}")
+            raise PlexConnectionError(f"Plex service timeout {action}")
         except httpx.RequestError as e:
-            self.logger.error(f"Network error creating Plex PIN: {e}")
+            self.logger.error(f"Network error {action}: {e}")
             raise PlexConnectionError(f"Network error: {e}")
+        except (orjson.JSONDecodeError, ET.ParseError, DefusedXmlException) as e:
+            self.logger.error(f"Failed to parse Plex response {action}: {e}")
+            raise parse_error("Invalid response from Plex")
         except Exception as e:
-            self.logger.error(f"Unexpected error creating Plex PIN: {e}")
-            raise ExternalServiceError(f"PIN creation failed: {e}")
+            self.logger.error(f"Unexpected error {action}: {e}")
+            raise ExternalServiceError(f"Plex request failed {action}: {e}")
 
-        return None
+    @with_plex_retry()
+    async def create_pin(self) -> Optional[Dict[str, Any]]:
+        """Create a new PIN for Plex OAuth authentication"""
+        self.logger.info("Creating Plex authentication PIN")
+
+        # No token yet - the client's default headers are all this needs
+        data = await self._request_json(
+            "POST",
+            f"{self.base_url}/api/v2/pins?strong=true",
+            "creating Plex PIN",
+            "plex_create_pin",
+            expect=201,
+        )
+        if not data or "id" not in data or "code" not in data:
+            return None
+
+        pin_data = {"id": data["id"], "code": data["code"]}
+        self.logger.info(f"Successfully created Plex PIN: {pin_data['id']}")
+        return pin_data
 
     @with_plex_retry()
     async def check_pin(self, pin_id: int) -> Optional[str]:
         """Check if a PIN has been authenticated and return auth token"""
-        start_time = datetime.now()
-
-        try:
-            self.logger.debug(f"Checking Plex PIN: {pin_id}")
+        self.logger.debug(f"Checking Plex PIN: {pin_id}")
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v2/pins/{pin_id}", headers=self._get_headers()
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    auth_token = data.get("authToken")
-
-                    # Log performance
-                    duration = (datetime.now() - start_time).total_seconds() * 1000
-                    performance_logger.log_request_duration(
-                        "plex_check_pin", "GET", duration, response.status_code
-                    )
-
-                    if auth_token:
-                        self.logger.info(f"PIN {pin_id} successfully authenticated")
-                        return str(auth_token) if auth_token else None
-                    else:
-                        self.logger.debug(f"PIN {pin_id} not yet authenticated")
-                        return None
-                else:
-                    self.logger.warning(f"Failed to check PIN {pin_id}: {response.status_code}")
+        data = await self._request_json(
+            "GET",
+            f"{self.base_url}/api/v2/pins/{pin_id}",
+            f"checking PIN {pin_id}",
+            "plex_check_pin",
+        )
+        if data is None:
+            return None
 
-        except httpx.TimeoutException:
-            self.logger.error(f"Timeout checking PIN {pin_id}")
-            raise PlexConnectionError("Plex service timeout during PIN check")
-        except httpx.RequestError as e:
-            self.logger.error(f"Network error checking PIN {pin_id}: {e}")
-            raise PlexConnectionError(f"Network error: {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error checking PIN {pin_id}: {e}")
-            raise ExternalServiceError(f"PIN check failed: {e}")
+        auth_token = data.get("authToken")
+        if auth_token:
+            self.logger.info(f"PIN {pin_id} successfully authenticated")
+            return str(auth_token)
 
+        self.logger.debug(f"PIN {pin_id} not yet authenticated")
         return None
 
     @with_plex_retry()
     async def authenticate_user(self, auth_token: str) -> Optional[PlexUser]:
         """Authenticate user with Plex token and return user info"""
-        start_time = datetime.now()
-
-        try:
-            self.logger.info("Authenticating user with Plex token")
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                headers = self._get_headers(auth_token)
-
-                response = await client.get(f"{self.base_url}/users/account", headers=headers)
-
-                if response.status_code == 200:
-                    # Plex returns XML for user account details
-                    xml_content = response.text
-                    root = ET.fromstring(xml_content)
-
-                    if root.tag == "user":
-                        user = PlexUser(
-                            user_id=root.get("id", ""),
-                            username=root.get("username", ""),
-                            email=root.get("email", ""),
-                            thumb=root.get("thumb", ""),
-                            is_home_user=root.get("home", "0") == "1",
-                            is_restricted=root.get("restricted", "0") == "1",
-                        )
-
-                        # Log performance
-                        duration = (datetime.now() - start_time).total_seconds() * 1000
-                        performance_logger.log_request_duration(
-                            "plex_authenticate_user",
-                            "GET",
-                            duration,
-                            response.status_code,
-                        )
-
-                        self.logger.info(f"Successfully authenticated user: {user.username}")
-                        return user
-                else:
-                    self.logger.warning(f"Failed to authenticate user: {response.status_code}")
-                    raise PlexAuthenticationError("Invalid Plex token")
-
-        except PlexAuthenticationError:
-            raise
-        except httpx.TimeoutException:
-            self.logger.error("Timeout authenticating user")
-            raise PlexConnectionError("Plex service timeout during authentication")
-        except httpx.RequestError as e:
-            self.logger.error(f"Network error authenticating user: {e}")
-            raise PlexConnectionError(f"Network error: {e}")
-        except ET.ParseError as e:
-            self.logger.error(f"Failed to parse Plex XML response: {e}")
-            raise PlexAuthenticationError("Invalid response from Plex")
-        except Exception as e:
-            self.logger.error(f"Unexpected error authenticating user: {e}")
-            raise ExternalServiceError(f"Authentication failed: {e}")
+        self.logger.info("Authenticating user with Plex token")
+
+        data = await self._request_json(
+            "GET",
+            f"{self.base_url}/users/account",
+            "authenticating user",
+            "plex_authenticate_user",
+            token=auth_token,
+            # A garbled account response means the sign-in failed, not a retryable outage
+            parse_error=PlexAuthenticationError,
+        )
+        if data is None:
+            raise PlexAuthenticationError("Invalid Plex token")
 
-        return None
+        user = self._parse_user_from_json(data)
+        if user:
+            self.logger.info(f"Successfully authenticated user: {user.username}")
+        return user
 
     async def get_current_session(self, plex_token: str, username: str) -> Optional[SessionInfo]:
         """Get user's current playback session"""
         try:
             self.logger.debug(f"Getting current session for user: {username}")
 
-            # Get sessions with server context
-            sessions_with_servers = await self._get_all_user_sessions_with_server_context(
-                plex_token
-            )
+            # Stops at the first server that has a session for this user
+            match = await self._find_first_user_session(plex_token, username.casefold())
 
-            for session, server in sessions_with_servers:
-                if session.username.lower() == username.lower():
-                    self.logger.info(f"Found current session for user {username}")
-                    # Set server context for file path resolution
-                    setattr(session, "_server_context", server)
-                    return session
+            if match:
+                session, server = match
+                self.logger.info(f"Found current session for user {username}")
+                # Set server context for file path resolution
+                session.server_context = server
+                return session
 
             self.logger.debug(f"No current session found for user: {username}")
             return None
@@ -239,16 +286,17 @@ class PlexService(IPlexService):
             self.logger.debug(f"Getting all sessions for user: {username}")
 
             user_sessions = []
+            target = username.casefold()
 
             # Get sessions with server context
             sessions_with_servers = await self._get_all_user_sessions_with_server_context(
-                plex_token
+                plex_token, username_filter=target
             )
 
             for session, server in sessions_with_servers:
-                if session.username.lower() == username.lower():
+                if session.username.casefold() == target:
                     # Set server context for file path resolution
-                    setattr(session, "_server_context", server)
+                    session.server_context = server
                     user_sessions.append(session)
 
             self.logger.info(f"Found {len(user_sessions)} sessions for user {username}")
@@ -265,19 +313,18 @@ class PlexService(IPlexService):
         try:
             self.logger.debug(f"Getting session by key {session_key} for user: {username}")
 
+            target = username.casefold()
+
             # Get sessions with server context
             sessions_with_servers = await self._get_all_user_sessions_with_server_context(
-                plex_token
+                plex_token, username_filter=target
             )
 
             for session, server in sessions_with_servers:
-                if (
-                    session.username.lower() == username.lower()
-                    and session.session_key == session_key
-                ):
+                if session.username.casefold() == target and session.session_key == session_key:
                     self.logger.info(f"Found session {session_key} for user {username}")
                     # Set server context for file path resolution
-                    setattr(session, "_server_context", server)
+                    session.server_context = server
                     return session
 
             self.logger.debug(f"No session found with key {session_key} for user: {username}")
@@ -287,8 +334,29 @@ class PlexService(IPlexService):
             self.logger.error(f"Failed to get session by key {session_key} for {username}: {e}")
             raise SessionNotFoundError(f"Failed to retrieve session by key: {e}")
 
-    @with_plex_retry()
+    @staticmethod
+    def _token_cache_key(token: str) -> str:
+        """Cache key for per-token lookups, so raw tokens never sit in the cache"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    async def invalidate_server_cache(self, token: str) -> None:
+        """Forget cached server lookups for a token"""
+        await get_cache().invalidate_plex_servers(self._token_cache_key(token))
+
     async def _get_server_identity_from_token(self, token: str) -> Optional[PlexServer]:
+        """Get server identity directly using an admin token, cached per token"""
+        cache = get_cache()
+        cache_key = self._token_cache_key(token)
+
+        server: Optional[PlexServer] = await cache.get_plex_server_identity(cache_key)
+        if server is None:
+            server = await self._fetch_server_identity(token)
+            if server is not None:
+                await cache.set_plex_server_identity(cache_key, server)
+        return server
+
+    @with_plex_retry()
+    async def _fetch_server_identity(self, token: str) -> Optional[PlexServer]:
         """Get server identity directly using an admin token"""
         try:
             self.logger.debug("Getting server identity using admin token")
@@ -300,34 +368,28 @@ class PlexService(IPlexService):
                 self.logger.warning("No servers found with provided token")
                 return None
 
-            # For an admin token, the first owned server is typically the right one
-            for server in servers:
-                if server.owned:
-                    # Now get detailed server info using the identity endpoint
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        headers = self._get_headers(token)
-                        headers["Accept"] = "application/json"
-
-                        try:
-                            # Try to get server identity for confirmation
-                            identity_response = await client.get(
-                                f"{server.url}/identity", headers=headers
-                            )
-
-                            if identity_response.status_code == 200:
-                                identity_data = identity_response.json()
-                                # Update server with confirmed identity
-                                server.machine_identifier = identity_data.get(
-                                    "MediaContainer", {}
-                                ).get("machineIdentifier", server.machine_identifier)
-                                self.logger.info(
-                                    f"Identified server: {server.name} (ID: {server.machine_identifier})"
-                                )
-                                return server  # type: ignore[no-any-return]
-                        except Exception as e:
-                            self.logger.debug(f"Could not get identity from {server.url}: {e}")
-                            # Still return the server even if identity check fails
-                            return server  # type: ignore[no-any-return]
+            # For an admin token, the first owned server is typically the right one. Resolve
+            # the identity of every owned server at once, then take the results in server order.
+            owned_servers = [server for server in servers if server.owned]
+            headers = self._get_headers(token)
+            machine_ids = await asyncio.gather(
+                *[self._get_machine_identifier(server, headers) for server in owned_servers],
+                return_exceptions=True,
+            )
+
+            for server, machine_id in zip(owned_servers, machine_ids):
+                if isinstance(machine_id, BaseException):
+                    self.logger.debug(f"Could not get identity from {server.url}: {machine_id}")
+                    # Still return the server even if identity check fails
+                    return server  # type: ignore[no-any-return]
+
+                if machine_id is not None:
+                    # Update server with confirmed identity
+                    server.machine_identifier = machine_id
+                    self.logger.info(
+                        f"Identified server: {server.name} (ID: {server.machine_identifier})"
+                    )
+                    return server  # type: ignore[no-any-return]
 
             # If no owned servers, return the first one
             if servers:
@@ -340,120 +402,94 @@ class PlexService(IPlexService):
             self.logger.error(f"Failed to get server identity from token: {e}")
             return None
 
-    @with_plex_retry()
-    async def _get_user_servers(self, token: str) -> List[PlexServer]:
-        """Get list of Plex servers the user has access to"""
-        start_time = datetime.now()
+    async def _get_machine_identifier(
+        self, server: PlexServer, headers: Mapping[str, str]
+    ) -> Optional[str]:
+        """Get a server's machineIdentifier from /identity, cached per server URL
 
-        try:
-            self.logger.debug("Fetching user's Plex servers")
+        Returns None when the server answers with a non-200 status.
+        """
+        cache = get_cache()
+        machine_id = await cache.get_plex_machine_identifier(server.url)
+        if machine_id is not None:
+            return machine_id
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/pms/servers", headers=self._get_headers(token)
-                )
+        response = await self._client.get(f"{server.url}/identity", headers=headers)
+        if response.status_code != 200:
+            return None
 
-                if response.status_code == 200:
-                    # Plex returns XML for servers list
-                    xml_content = response.text
-                    root = ET.fromstring(xml_content)
-
-                    servers = []
-                    server_elements = root.findall("Server")
-
-                    for server_element in server_elements:
-                        server_name = server_element.get("name", "")
-
-                        # Parse server connections
-                        connections = []
-                        for connection_element in server_element.findall("Connection"):
-                            connection = PlexServerConnection(
-                                protocol=connection_element.get("protocol", "http"),
-                                address=connection_element.get("address", ""),
-                                port=int(connection_element.get("port", 32400)),
-                                uri=connection_element.get("uri", ""),
-                                local=connection_element.get("local", "0") == "1",
-                            )
-                            connections.append(connection)
-
-                        # Create server object
-                        server = PlexServer(
-                            name=server_name,
-                            machine_identifier=server_element.get("machineIdentifier", ""),
-                            host=server_element.get("host", ""),
-                            port=int(server_element.get("port", 32400)),
-                            version=server_element.get("version", ""),
-                            scheme=server_element.get("scheme", "http"),
-                            connections=connections,
-                            owned=server_element.get("owned", "1") == "1",
-                            synced=server_element.get("synced", "0") == "1",
-                            access_token=server_element.get("accessToken"),
-                        )
-                        servers.append(server)
+        identity_data = orjson.loads(response.content)
+        machine_id = identity_data.get("MediaContainer", {}).get("machineIdentifier")
+        if not machine_id:
+            return server.machine_identifier
 
-                    # Log performance
-                    duration = (datetime.now() - start_time).total_seconds() * 1000
-                    performance_logger.log_request_duration(
-                        "plex_get_servers", "GET", duration, response.status_code
-                    )
+        await cache.set_plex_machine_identifier(server.url, machine_id)
+        return machine_id  # type: ignore[no-any-return]
 
-                    self.logger.info(f"Retrieved {len(servers)} Plex servers")
-                    return servers
-                else:
-                    self.logger.warning(f"Failed to get servers: {response.status_code}")
+    async def _get_user_servers(self, token: str) -> List[PlexServer]:
+        """Get list of Plex servers the user has access to, cached per token"""
+        cache = get_cache()
+        cache_key = self._token_cache_key(token)
 
-        except httpx.TimeoutException:
-            self.logger.error("Timeout getting Plex servers")
-            raise PlexConnectionError("Plex service timeout getting servers")
-        except httpx.RequestError as e:
-            self.logger.error(f"Network error getting servers: {e}")
-            raise PlexConnectionError(f"Network error: {e}")
-        except ET.ParseError as e:
-            self.logger.error(f"Failed to parse servers XML response: {e}")
-            raise PlexConnectionError("Invalid response from Plex")
-        except Exception as e:
-            self.logger.error(f"Unexpected error getting servers: {e}")
-            raise ExternalServiceError(f"Failed to get servers: {e}")
+        servers: Optional[List[PlexServer]] = await cache.get_plex_servers(cache_key)
+        if servers is None:
+            servers = await self._fetch_user_servers(token)
+            if servers:
+                await cache.set_plex_servers(cache_key, servers)
+        return servers
 
-        return []
+    @with_plex_retry()
+    async def _fetch_user_servers(self, token: str) -> List[PlexServer]:
+        """Get list of Plex servers the user has access to"""
+        self.logger.debug("Fetching user's Plex servers")
+
+        data = await self._request_json(
+            "GET", f"{self.base_url}/pms/servers", "getting Plex servers", "plex_get_servers", token
+        )
+        if data is None:
+            return []
+
+        servers = self._parse_servers_from_json(data)
+        self.logger.info(f"Retrieved {len(servers)} Plex servers")
+        return servers
 
     @with_plex_retry()
-    async def _get_server_sessions(self, token: str, server: PlexServer) -> List[SessionInfo]:
-        """Get all current sessions from a specific Plex server"""
+    async def _get_server_sessions(
+        self, token: str, server: PlexServer, username_filter: Optional[str] = None
+    ) -> List[SessionInfo]:
+        """Get current sessions from a specific Plex server, optionally for one user only"""
         try:
             self.logger.debug(f"Getting sessions from server: {server.name}")
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Use server-specific token for shared servers, user token for owned servers
-                token_to_use = (
-                    server.access_token if server.access_token and not server.owned else token
-                )
-
-                # Force JSON response
-                headers = self._get_headers(token_to_use)
-                headers["Accept"] = "application/json"
+            # Use server-specific token for shared servers, user token for owned servers
+            token_to_use = (
+                server.access_token if server.access_token and not server.owned else token
+            )
 
-                response = await client.get(f"{server.url}/status/sessions", headers=headers)
+            headers = self._get_headers(token_to_use)
 
+            # Stream the body so a large admin session dump is never held in memory whole
+            async with self._client.stream(
+                "GET", f"{server.url}/status/sessions", headers=headers
+            ) as response:
                 if response.status_code == 200:
-                    content = response.text
-
-                    if not content.strip():
-                        return []
-
                     try:
-                        json_data = json.loads(content)
-                        sessions = self._parse_sessions_from_json(json_data)
+                        sessions = await self._stream_sessions_from_json(response, username_filter)
                         self.logger.debug(f"Found {len(sessions)} sessions on server {server.name}")
                         return sessions
-                    except json.JSONDecodeError:
+                    except ijson.JSONError:
                         self.logger.warning(f"Failed to parse JSON from server {server.name}")
                         return []
                 else:
                     self.logger.warning(
                         f"Server {server.name} returned {response.status_code} for session request"
                     )
-                    if response.status_code == 403:
+                    if response.status_code == 401:
+                        # The token was rejected, so the cached server list may be stale too.
+                        # A 403 is the normal answer for shared-server users without an admin
+                        # token, so it must not empty the cache on every poll.
+                        await self.invalidate_server_cache(token)
+                    elif response.status_code == 403:
                         self.logger.info(
                             "Consider using CLIPFORGE_PLEX_SERVER_TOKEN with admin privileges"
                         )
@@ -467,12 +503,8 @@ class PlexService(IPlexService):
 
         return []
 
-    async def _get_all_user_sessions_with_server_context(
-        self, token: str
-    ) -> List[Tuple[SessionInfo, PlexServer]]:
-        """Get sessions from user's servers with server context"""
-        sessions_with_servers = []
-
+    async def _get_session_servers(self, token: str) -> Tuple[str, List[PlexServer]]:
+        """Get the servers to poll for sessions and the token to poll them with"""
         # Check if we have a server token configured
         server_token = (
             settings.plex_server_token if hasattr(settings, "plex_server_token") else None
@@ -480,68 +512,202 @@ class PlexService(IPlexService):
 
         # Priority: server token > server name > first available
         if server_token:
-            # Use server token to get server identity and all sessions
+            # Use server token to get server identity and all sessions (admin access)
             self.logger.info("Using configured server token for session fetching")
             server = await self._get_server_identity_from_token(server_token)
 
-            if server:
-                try:
-                    # Use the server token to get all sessions (admin access)
-                    server_sessions = await self._get_server_sessions(server_token, server)
-                    for session in server_sessions:
-                        sessions_with_servers.append((session, server))
-                except Exception as e:
-                    self.logger.warning(f"Failed to get sessions from server {server.name}: {e}")
-            else:
+            if not server:
                 self.logger.error("Could not identify server from provided token")
-                return []
-        else:
-            # Fall back to original logic if no server token
-            target_server_name = (
-                settings.plex_server_name if hasattr(settings, "plex_server_name") else None
-            )
+                return server_token, []
+            return server_token, [server]
 
-            # Get user's servers using their token
-            servers = await self._get_user_servers(token)
+        # Fall back to original logic if no server token
+        target_server_name = (
+            settings.plex_server_name if hasattr(settings, "plex_server_name") else None
+        )
 
-            # Filter to target server if specified
-            if target_server_name:
-                available_names = [s.name for s in servers]
-                servers = [s for s in servers if s.name == target_server_name]
-                if not servers:
-                    self.logger.warning(
-                        f"Target server '{target_server_name}' not found. Available: {available_names}"
-                    )
-                    return []
+        # Get user's servers using their token
+        servers = await self._get_user_servers(token)
 
-            # Get sessions from servers using user token
-            for server in servers:
-                try:
-                    server_sessions = await self._get_server_sessions(token, server)
-                    for session in server_sessions:
-                        sessions_with_servers.append((session, server))
-                except Exception as e:
-                    self.logger.warning(f"Failed to get sessions from server {server.name}: {e}")
-                    continue
+        # Filter to target server if specified
+        if target_server_name:
+            available_names = [s.name for s in servers]
+            servers = [s for s in servers if s.name == target_server_name]
+            if not servers:
+                self.logger.warning(
+                    f"Target server '{target_server_name}' not found. Available: {available_names}"
+                )
 
-        return sessions_with_servers
+        return token, servers
 
-    def _parse_sessions_from_json(self, json_data: Dict[str, Any]) -> List[SessionInfo]:
-        """Parse sessions from JSON response"""
-        sessions = []
+    async def _get_server_sessions_safe(
+        self, token: str, server: PlexServer, username_filter: Optional[str]
+    ) -> Tuple[PlexServer, List[SessionInfo]]:
+        """Get a server's sessions paired with the server, logging failures as no sessions"""
+        try:
+            return server, await self._get_server_sessions(token, server, username_filter)
+        except Exception as e:
+            self.logger.warning(f"Failed to get sessions from server {server.name}: {e}")
+            return server, []
 
+    async def _get_all_user_sessions_with_server_context(
+        self, token: str, username_filter: Optional[str] = None
+    ) -> List[Tuple[SessionInfo, PlexServer]]:
+        """Get sessions from user's servers with server context
+
+        username_filter is a casefolded username; other users' sessions are skipped
+        before they are parsed.
+        """
+        session_token, servers = await self._get_session_servers(token)
+
+        # Servers are independent, so query them all at once
+        results = await asyncio.gather(
+            *[
+                self._get_server_sessions_safe(session_token, server, username_filter)
+                for server in servers
+            ]
+        )
+        return [(session, server) for server, sessions in results for session in sessions]
+
+    async def _find_first_user_session(
+        self, token: str, username_filter: str
+    ) -> Optional[Tuple[SessionInfo, PlexServer]]:
+        """Find a session for the (casefolded) username on whichever server answers first"""
+        session_token, servers = await self._get_session_servers(token)
+
+        tasks = [
+            asyncio.create_task(
+                self._get_server_sessions_safe(session_token, server, username_filter)
+            )
+            for server in servers
+        ]
         try:
-            media_container = json_data.get("MediaContainer", {})
-            metadata_list = media_container.get("Metadata", [])
+            for next_done in asyncio.as_completed(tasks):
+                server, sessions = await next_done
+                for session in sessions:
+                    if session.username.casefold() == username_filter:
+                        return session, server
+            return None
+        finally:
+            # Don't wait on slower servers once there is an answer
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _plex_items(value: Any) -> List[Dict[str, Any]]:
+        """Normalize a Plex JSON child element, which may be one object or a list"""
+        if not value:
+            return []
+        items = value if isinstance(value, list) else [value]
+        # XML-converted responses nest attributes under "@attributes"
+        return [item.get("@attributes", item) for item in items]
+
+    @staticmethod
+    def _plex_flag(value: Any, default: bool = False) -> bool:
+        """Read a Plex boolean, sent as true/false or as "1"/"0" depending on the endpoint"""
+        if value is None:
+            return default
+        if isinstance(value, bool):
+            return value
+        return str(value).lower() in ("1", "true")
+
+    def _parse_user_from_json(self, json_data: Dict[str, Any]) -> Optional[PlexUser]:
+        """Parse the account from a /users/account JSON response"""
+        users = self._plex_items(json_data.get("user"))
+        if not users:
+            return None
 
-            for metadata in metadata_list:
-                session = self._parse_session_from_json(metadata)
-                if session:
-                    sessions.append(session)
+        user = users[0]
+        return PlexUser(
+            user_id=str(user.get("id", "")),
+            username=user.get("username", ""),
+            email=user.get("email", ""),
+            thumb=user.get("thumb", ""),
+            is_home_user=self._plex_flag(user.get("home")),
+            is_restricted=self._plex_flag(user.get("restricted")),
+        )
 
-        except Exception as e:
-            self.logger.error(f"Failed to parse sessions JSON: {e}")
+    def _parse_servers_from_json(self, json_data: Dict[str, Any]) -> List[PlexServer]:
+        """Parse servers from a /pms/servers JSON response"""
+        servers = []
+        media_container = json_data.get("MediaContainer", {})
+        # Looked up once rather than per server and per connection
+        plex_items = self._plex_items
+        plex_flag = self._plex_flag
+
+        for server_data in plex_items(media_container.get("Server")):
+            # Parse server connections
+            connections = [
+                PlexServerConnection(
+                    protocol=connection_data.get("protocol", "http"),
+                    address=connection_data.get("address", ""),
+                    port=int(connection_data.get("port", 32400)),
+                    uri=connection_data.get("uri", ""),
+                    local=plex_flag(connection_data.get("local")),
+                )
+                for connection_data in plex_items(server_data.get("Connection"))
+            ]
+
+            servers.append(
+                PlexServer(
+                    name=server_data.get("name", ""),
+                    machine_identifier=server_data.get("machineIdentifier", ""),
+                    host=server_data.get("host", ""),
+                    port=int(server_data.get("port", 32400)),
+                    version=server_data.get("version", ""),
+                    scheme=server_data.get("scheme", "http"),
+                    connections=connections,
+                    owned=plex_flag(server_data.get("owned"), default=True),
+                    synced=plex_flag(server_data.get("synced")),
+                    access_token=server_data.get("accessToken"),
+                )
+            )
+
+        return servers
+
+    async def _stream_sessions_from_json(
+        self, response: httpx.Response, username_filter: Optional[str] = None
+    ) -> List[SessionInfo]:
+        """Parse sessions from a streamed JSON response one Metadata item at a time"""
+        sessions: List[SessionInfo] = []
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, "MediaContainer.Metadata.item", use_float=True)
+        received = False
+
+        async for chunk in response.aiter_bytes():
+            if not received and chunk.strip():
+                received = True
+            parser.send(chunk)
+            sessions.extend(self._parse_session_items(items, username_filter))
+
+        # An empty body means no sessions rather than malformed JSON
+        if not received:
+            return []
+
+        parser.close()
+        sessions.extend(self._parse_session_items(items, username_filter))
+        return sessions
+
+    def _parse_session_items(
+        self, items: List[Dict[str, Any]], username_filter: Optional[str] = None
+    ) -> List[SessionInfo]:
+        """Parse and consume the Metadata items decoded so far, skipping other users' sessions"""
+        sessions = []
+
+        for metadata in items:
+            # Check the owner before paying for the full session parse
+            if (
+                username_filter
+                and metadata.get("User", {}).get("title", "").casefold() != username_filter
+            ):
+                continue
+
+            session = self._parse_session_from_json(metadata)
+            if session:
+                sessions.append(session)
 
+        del items[:]
         return sessions
 
     def _parse_session_from_json(self, metadata: Dict[str, Any]) -> Optional[SessionInfo]:
@@ -586,18 +752,8 @@ class PlexService(IPlexService):
             if media.duration and media.duration > 0:
                 session_info.progress_percent = (view_offset / media.duration) * 100
 
-            # Extract original file info from media streams
-            original_file_info = None
-            if media.media_streams:
-                for stream in media.media_streams:
-                    if stream.parts:
-                        for part in stream.parts:
-                            if part.file:
-                                original_file_info = OriginalFileInfo(file_path=part.file)
-                                self.logger.debug(f"Extracted file path from session: {part.file}")
-                                break
-                    if original_file_info:
-                        break
+            # Extract original file info from the raw Media -> Part arrays
+            original_file_info = self._parse_original_file_from_json(metadata)
 
             return SessionInfo(
                 session_key=session_key,
@@ -615,29 +771,7 @@ class PlexService(IPlexService):
 
     def _parse_player_from_json(self, player_data: Dict[str, Any]) -> PlayerInfo:
         """Parse player information from JSON"""
-        return PlayerInfo(
-            machine_identifier=player_data.get("machineIdentifier", ""),
-            product=player_data.get("product", ""),
-            platform=player_data.get("platform", ""),
-            platform_version=player_data.get("platformVersion", ""),
-            device=player_data.get("device", ""),
-            model=player_data.get("model", ""),
-            vendor=player_data.get("vendor"),
-            version=player_data.get("version", ""),
-            address=player_data.get("address", ""),
-            port=player_data.get("port"),
-            protocol=player_data.get("protocol"),
-            protocol_version=player_data.get("protocolVersion"),
-            protocol_capabilities=player_data.get("protocolCapabilities"),
-            title=player_data.get("title", ""),
-            device_class=player_data.get("deviceClass"),
-            profile=player_data.get("profile"),
-            remote_public_address=player_data.get("remotePublicAddress"),
-            local=player_data.get("local"),
-            relay=player_data.get("relay"),
-            secure=player_data.get("secure"),
-            user_id=player_data.get("userID"),
-        )
+        return PlayerInfo.model_validate(player_data)
 
     def _parse_session_info_from_json(self, session_data: Dict[str, Any]) -> PlexSessionInfo:
         """Parse session information from JSON"""
@@ -668,10 +802,10 @@ class PlexService(IPlexService):
         """Parse media information from JSON metadata"""
         try:
             # Parse media streams
-            media_streams = self._parse_media_streams_from_json(metadata.get("Media", []))
+            media_streams = self._parse_media_streams_from_json(metadata.get("Media", _NO_ITEMS))
 
             # Parse GUIDs
-            guids = self._parse_guids_from_json(metadata.get("Guid", []))
+            guids = self._parse_guids_from_json(metadata.get("Guid", _NO_ITEMS))
 
             return MediaInfo(
                 key=metadata.get("key", ""),
@@ -720,42 +854,62 @@ class PlexService(IPlexService):
             return None
 
     def _parse_media_streams_from_json(
-        self, media_data: List[Dict[str, Any]]
+        self, media_data: Iterable[Dict[str, Any]]
     ) -> List[PlexStreamMedia]:
         """Parse media streams from JSON"""
-        streams = []
-        for stream_data in media_data:
-            parts = self._parse_parts_from_json(stream_data.get("Part", []))
-
-            stream = PlexStreamMedia(
+        return [
+            PlexStreamMedia(
                 id=str(stream_data.get("id", "")),
                 duration=stream_data.get("duration"),
                 bitrate=stream_data.get("bitrate"),
-                parts=parts,
+                parts=self._parse_parts_from_json(stream_data.get("Part", _NO_ITEMS)),
             )
-            streams.append(stream)
-        return streams
+            for stream_data in media_data
+        ]
 
-    def _parse_parts_from_json(self, parts_data: List[Dict[str, Any]]) -> List[PlexStreamPart]:
+    def _parse_parts_from_json(self, parts_data: Iterable[Dict[str, Any]]) -> List[PlexStreamPart]:
         """Parse media parts from JSON"""
-        parts = []
-        for part_data in parts_data:
-            part = PlexStreamPart(
+        return [
+            PlexStreamPart(
                 id=str(part_data.get("id", "")),
                 key=part_data.get("key"),
                 duration=part_data.get("duration"),
                 file=part_data.get("file"),
+                frame_rate=self._parse_frame_rate_from_json(part_data),
             )
-            parts.append(part)
-        return parts
+            for part_data in parts_data
+        ]
+
+    def _parse_original_file_from_json(
+        self, metadata: Dict[str, Any]
+    ) -> Optional[OriginalFileInfo]:
+        """Get the first part with a file path straight from raw item metadata"""
+        for media_data in metadata.get("Media", _NO_ITEMS):
+            for part_data in media_data.get("Part", _NO_ITEMS):
+                file_path = part_data.get("file")
+                if file_path:
+                    self.logger.debug(f"Found file path: {file_path}")
+                    return OriginalFileInfo(
+                        file_path=file_path,
+                        frame_rate=self._parse_frame_rate_from_json(part_data),
+                    )
+        return None
 
-    def _parse_guids_from_json(self, guids_data: List[Dict[str, Any]]) -> List[PlexGuid]:
+    def _parse_frame_rate_from_json(self, part_data: Dict[str, Any]) -> Optional[float]:
+        """Get the video stream frame rate Plex already analysed for a part"""
+        for stream_data in part_data.get("Stream", _NO_ITEMS):
+            # streamType 1 is video
+            if stream_data.get("streamType") == 1 and stream_data.get("frameRate"):
+                try:
+                    frame_rate = float(stream_data["frameRate"])
+                except (TypeError, ValueError):
+                    return None
+                return frame_rate if frame_rate > 0 else None
+        return None
+
+    def _parse_guids_from_json(self, guids_data: Iterable[Dict[str, Any]]) -> List[PlexGuid]:
         """Parse GUIDs from JSON"""
-        guids = []
-        for guid_data in guids_data:
-            if guid_data.get("id"):
-                guids.append(PlexGuid(id=guid_data["id"]))
-        return guids
+        return [PlexGuid(id=guid_data["id"]) for guid_data in guids_data if guid_data.get("id")]
 
     def _parse_timestamp(self, timestamp_value: Any) -> Optional[datetime]:
         """Parse timestamp from various Plex formats"""
@@ -764,12 +918,9 @@ class PlexService(IPlexService):
 
         try:
             if isinstance(timestamp_value, (int, float)):
-                return datetime.fromtimestamp(timestamp_value)
+                return _epoch_to_datetime(timestamp_value)
             elif isinstance(timestamp_value, str):
-                try:
-                    return datetime.fromtimestamp(float(timestamp_value))
-                except ValueError:
-                    return datetime.fromisoformat(timestamp_value.replace("Z", "+00:00"))
+                return _parse_timestamp_text(timestamp_value)
         except Exception as e:
             self.logger.warning(f"Failed to parse timestamp {timestamp_value}: {e}")
 
@@ -783,42 +934,28 @@ class PlexService(IPlexService):
         try:
             self.logger.debug(f"Getting media file info for key: {media_key}")
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                headers = self._get_headers(token)
-                headers["Accept"] = "application/json"
-
-                response = await client.get(f"{server.url}{media_key}", headers=headers)
+            headers = self._get_headers(token)
 
-                if response.status_code == 200:
-                    json_data = response.json()
-                    media_container = json_data.get("MediaContainer", {})
-                    metadata_list = media_container.get("Metadata", [])
-
-                    if metadata_list:
-                        metadata = metadata_list[0]
-                        media_list = metadata.get("Media", [])
-
-                        if media_list:
-                            media = media_list[0]
-                            part_list = media.get("Part", [])
+            response = await self._client.get(f"{server.url}{media_key}", headers=headers)
 
-                            if part_list:
-                                part = part_list[0]
-                                file_path = part.get("file")
+            if response.status_code == 200:
+                json_data = orjson.loads(response.content)
+                metadata_list = json_data.get("MediaContainer", {}).get("Metadata", _NO_ITEMS)
 
-                                if file_path:
-                                    self.logger.debug(f"Found file path: {file_path}")
-                                    return OriginalFileInfo(file_path=file_path)
-                else:
-                    self.logger.warning(
-                        f"Failed to get media file info: {response.status_code} for {media_key}"
+                if metadata_list:
+                    original_file_info = self._parse_original_file_from_json(metadata_list[0])
+                    if original_file_info:
+                        return original_file_info
+            else:
+                self.logger.warning(
+                    f"Failed to get media file info: {response.status_code} for {media_key}"
+                )
+                if response.status_code == 401:
+                    self.logger.error(
+                        f"Authentication failed - token may not have sufficient permissions. Token used: {token[:5]}...{token[-5:] if len(token) > 10 else ''}"
                     )
-                    if response.status_code == 401:
-                        self.logger.error(
-                            f"Authentication failed - token may not have sufficient permissions. Token used: {token[:5]}...{token[-5:] if len(token) > 10 else ''}"
-                        )
-                    elif response.status_code == 404:
-                        self.logger.error(f"Media not found: {media_key}")
+                elif response.status_code == 404:
+                    self.logger.error(f"Media not found: {media_key}")
 
             self.logger.warning(f"No file path found for media key: {media_key}")
             return None
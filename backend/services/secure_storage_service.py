@@ -3,7 +3,8 @@ Secure storage service for ClipForge
 Handles secure file access with proper validation and user authorization
 """
 
-import hashlib
+import asyncio
+import functools
 import hmac
 import logging
 import os
@@ -11,22 +12,60 @@ import shutil
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 from core.config import settings
 from core.security import SecurityUtils
 from fastapi import HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from infrastructure.database import Clip, Edit, Snapshot, get_db_session
 from infrastructure.repositories import StorageStatsRepository
 from sqlalchemy import func
 
 logger = logging.getLogger(__name__)
 
+_MEDIA_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        ".mp4": "video/mp4",
+        ".webm": "video/webm",
+        ".mov": "video/quicktime",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".png": "image/png",
+    }
+)
+
+_SECURITY_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "X-Content-Type-Options": "nosniff",
+        "X-Frame-Options": "DENY",
+        "Cache-Control": "private, max-age=3600",
+    }
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _sign(secret: bytes, file_id: str, user_id: str, expires_at: Optional[int]) -> str:
+    """HMAC-SHA256 access signature, cached as clients re-request the same file URLs"""
+    # No trailing field without an expiry, so existing unexpiring signatures stay valid
+    message = (
+        f"{file_id}:{user_id}:{expires_at}" if expires_at else f"{file_id}:{user_id}"
+    ).encode("utf-8")
+    # One-shot hmac.digest runs entirely in OpenSSL instead of through the HMAC class
+    return hmac.digest(secret, message, "sha256").hex()
+
 
 class SecureStorageService:
     """Secure file storage and access service"""
 
+    # Name prefixes of the temporary frame images kept in the snapshots directory
+    _TEMP_PREFIXES = ("preview_start_", "preview_end_", "frame_", "multiframe_")
+    _TEMP_CLEANUP_PREFIXES = ("preview_", "frame_", "multiframe_")
+
+    # Created per request by the storage routes, so keep instances small
+    __slots__ = ("base_path", "secret_key", "_secret_bytes", "retention_days")
+
     def __init__(
         self,
         base_storage_path: Optional[str] = None,
@@ -41,6 +80,7 @@ class SecureStorageService:
         """
         self.base_path = Path(base_storage_path or settings.absolute_clips_path).resolve()
         self.secret_key = settings.jwt_secret
+        self._secret_bytes = self.secret_key.encode("utf-8")
         self.retention_days = retention_days or settings.clip_retention_days
 
         # Ensure base path exists and is secure
@@ -63,12 +103,7 @@ class SecureStorageService:
         Returns:
             HMAC signature for file access
         """
-        message_parts = [file_id, user_id]
-        if expires_at:
-            message_parts.append(str(expires_at))
-
-        message = ":".join(message_parts).encode("utf-8")
-        return hmac.new(self.secret_key.encode("utf-8"), message, hashlib.sha256).hexdigest()
+        return _sign(self._secret_bytes, file_id, user_id, expires_at)
 
     def verify_access_signature(
         self,
@@ -111,19 +146,36 @@ class SecureStorageService:
         Returns:
             Validated absolute path
 
+        Raises:
+            HTTPException: If path is invalid or unsafe
+        """
+        return self.get_secure_file_stat(relative_path)[0]
+
+    def get_secure_file_stat(self, relative_path: str) -> Tuple[Path, os.stat_result]:
+        """
+        Get secure file path with validation, along with the file's stat
+
+        Args:
+            relative_path: Relative path from base storage
+
+        Returns:
+            Validated absolute path and its stat result, reusable by FileResponse
+
         Raises:
             HTTPException: If path is invalid or unsafe
         """
         try:
             # Validate and resolve path
             secure_path = SecurityUtils.validate_file_path(
-                self.base_path / relative_path, self.base_path
+                self.base_path / relative_path, self.base_path, base_resolved=True
             )
 
-            if not secure_path.exists():
+            try:
+                file_stat = os.stat(secure_path)
+            except FileNotFoundError:
                 raise HTTPException(status_code=404, detail="File not found")
 
-            return secure_path
+            return secure_path, file_stat
 
         except ValueError as e:
             logger.warning(f"Path validation failed: {e}")
@@ -138,6 +190,7 @@ class SecureStorageService:
         filename: Optional[str] = None,
         media_type: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
+        stat_result: Optional[os.stat_result] = None,
     ) -> FileResponse:
         """
         Create secure file response with proper headers
@@ -147,6 +200,7 @@ class SecureStorageService:
             filename: Custom filename for download
             media_type: MIME type
             headers: Additional headers
+            stat_result: Already-fetched stat of the file, saves FileResponse another stat
 
         Returns:
             FileResponse with security headers
@@ -155,36 +209,21 @@ class SecureStorageService:
 
         # Auto-detect media type if not provided
         if not media_type:
-            ext = file_path.suffix.lower()
-            media_type_map = {
-                ".mp4": "video/mp4",
-                ".webm": "video/webm",
-                ".mov": "video/quicktime",
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-                ".png": "image/png",
-            }
-            media_type = media_type_map.get(ext, "application/octet-stream")
+            media_type = _MEDIA_TYPES.get(file_path.suffix.lower(), "application/octet-stream")
 
         # Set secure filename if not provided
         if not filename:
             filename = SecurityUtils.sanitize_filename(file_path.name)
 
         # Security headers
-        security_headers = {
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "Cache-Control": "private, max-age=3600",
-        }
-
-        if headers:
-            security_headers.update(headers)
+        security_headers = {**_SECURITY_HEADERS, **headers} if headers else _SECURITY_HEADERS
 
         return FileResponse(
             path=str(file_path),
             filename=filename,
             media_type=media_type,
             headers=security_headers,
+            stat_result=stat_result,
         )
 
     def stream_video_file(
@@ -202,8 +241,8 @@ class SecureStorageService:
             Secure FileResponse for video streaming
         """
         try:
-            # Validate file path security
-            secure_path = self.get_secure_file_path(file_path)
+            # Validate file path security; the stat saves FileResponse from repeating it
+            secure_path, file_stat = self.get_secure_file_stat(file_path)
 
             # Log access attempt
             logger.info(
@@ -221,6 +260,7 @@ class SecureStorageService:
                     "Accept-Ranges": "bytes",
                     "Content-Disposition": f'{disposition}; filename="{clip_id}.mp4"',
                 },
+                stat_result=file_stat,
             )
 
         except HTTPException:
@@ -243,7 +283,7 @@ class SecureStorageService:
         """
         try:
             # Validate file path security
-            secure_path = self.get_secure_file_path(file_path)
+            secure_path, file_stat = self.get_secure_file_stat(file_path)
 
             # Log access attempt
             logger.info(
@@ -259,6 +299,7 @@ class SecureStorageService:
                 filename=f"{image_id}{ext}",
                 media_type=media_type,
                 headers={"Content-Disposition": f'inline; filename="{image_id}{ext}"'},
+                stat_result=file_stat,
             )
 
         except HTTPException:
@@ -267,6 +308,29 @@ class SecureStorageService:
             logger.error(f"Failed to stream image {image_id} for user {user_id}: {e}")
             raise HTTPException(status_code=500, detail="Image streaming failed")
 
+    def stream_image_bytes(self, image_id: str, user_id: str, data: bytes) -> Response:
+        """
+        Serve an in-memory JPEG image with the same security headers as file responses
+
+        Args:
+            image_id: Image identifier
+            user_id: User requesting access
+            data: Encoded JPEG bytes
+
+        Returns:
+            Response containing the image
+        """
+        logger.info(f"Image stream request (memory) - Image: {image_id}, User: {user_id}")
+
+        return Response(
+            content=data,
+            media_type="image/jpeg",
+            headers={
+                **_SECURITY_HEADERS,
+                "Content-Disposition": f'inline; filename="{image_id}.jpg"',
+            },
+        )
+
     def stream_temporary_file(self, temp_file_id: str, user_id: str) -> FileResponse:
         """
         Stream temporary file (like preview frames) with security validation
@@ -284,32 +348,31 @@ class SecureStorageService:
 
             logger.debug(f"Looking for temporary file {temp_file_id} in {snapshots_dir}")
 
-            # Common patterns for temporary files
-            temp_patterns = [
-                f"preview_start_{temp_file_id}.jpg",
-                f"preview_end_{temp_file_id}.jpg",
-                f"frame_{temp_file_id}.jpg",
-                f"multiframe_{temp_file_id}.jpg",
-            ]
-
+            # One stat per candidate name; the result is reused for the response headers
+            temp_name = f"{temp_file_id}.jpg"
             temp_file_path = None
-            for pattern in temp_patterns:
-                potential_path = snapshots_dir / pattern
-                logger.debug(f"Checking pattern: {potential_path}")
-                if potential_path.exists():
-                    temp_file_path = potential_path
-                    logger.debug(f"Found matching file: {temp_file_path}")
-                    break
+            temp_stat = None
+            for prefix in self._TEMP_PREFIXES:
+                potential_path = snapshots_dir / f"{prefix}{temp_name}"
+                try:
+                    temp_stat = os.stat(potential_path)
+                except OSError:
+                    continue
+                temp_file_path = potential_path
+                logger.debug(f"Found matching file: {temp_file_path}")
+                break
 
             if not temp_file_path:
                 logger.warning(
                     f"Temporary file not found for ID {temp_file_id}. "
-                    f"Checked patterns: {temp_patterns} in {snapshots_dir}"
+                    f"Checked prefixes: {self._TEMP_PREFIXES} in {snapshots_dir}"
                 )
                 raise HTTPException(status_code=404, detail="Temporary file not found")
 
             # Validate path security
-            secure_path = SecurityUtils.validate_file_path(temp_file_path, self.base_path)
+            secure_path = SecurityUtils.validate_file_path(
+                temp_file_path, self.base_path, base_resolved=True
+            )
 
             # Log access attempt
             logger.info(
@@ -324,6 +387,7 @@ class SecureStorageService:
                     "Cache-Control": "private, max-age=300",
                     "Content-Disposition": f'inline; filename="{temp_file_id}.jpg"',
                 },
+                stat_result=temp_stat,
             )
 
         except HTTPException:
@@ -358,27 +422,39 @@ class SecureStorageService:
             cutoff_time = time.time() - (max_age_hours * 3600)
             snapshots_dir = self.base_path / "snapshots"
 
-            if not snapshots_dir.exists():
+            # Look for temporary files (preview_, frame_, multiframe_ patterns) in one pass
+            files_checked = files_deleted = bytes_freed = 0
+            try:
+                with os.scandir(snapshots_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not (
+                            name.startswith(self._TEMP_CLEANUP_PREFIXES) and name.endswith(".jpg")
+                        ):
+                            continue
+                        files_checked += 1
+
+                        try:
+                            entry_stat = entry.stat()
+                            if entry_stat.st_mtime < cutoff_time:
+                                os.unlink(entry.path)
+                                files_deleted += 1
+                                bytes_freed += entry_stat.st_size
+                                logger.debug(f"Deleted temporary file: {entry.path}")
+                        except FileNotFoundError:
+                            # Already removed by a concurrent cleanup
+                            continue
+                        except Exception as e:
+                            error_msg = f"Failed to delete {entry.path}: {e}"
+                            cleanup_stats["errors"].append(error_msg)
+                            logger.warning(error_msg)
+            except FileNotFoundError:
+                # No snapshots directory yet, so nothing to clean up
                 return cleanup_stats
-
-            # Look for temporary files (preview_, frame_, multiframe_ patterns)
-            temp_patterns = ["preview_*.jpg", "frame_*.jpg", "multiframe_*.jpg"]
-
-            for pattern in temp_patterns:
-                for temp_file in snapshots_dir.glob(pattern):
-                    cleanup_stats["files_checked"] = cleanup_stats["files_checked"] + 1
-
-                    try:
-                        if temp_file.stat().st_mtime < cutoff_time:
-                            file_size = temp_file.stat().st_size
-                            temp_file.unlink()
-                            cleanup_stats["files_deleted"] = cleanup_stats["files_deleted"] + 1
-                            cleanup_stats["bytes_freed"] = cleanup_stats["bytes_freed"] + file_size
-                            logger.debug(f"Deleted temporary file: {temp_file}")
-                    except Exception as e:
-                        error_msg = f"Failed to delete {temp_file}: {e}"
-                        cleanup_stats["errors"].append(error_msg)
-                        logger.warning(error_msg)
+            finally:
+                cleanup_stats["files_checked"] = files_checked
+                cleanup_stats["files_deleted"] = files_deleted
+                cleanup_stats["bytes_freed"] = bytes_freed
 
             logger.info(f"Temporary file cleanup completed: {cleanup_stats}")
             return cleanup_stats
@@ -418,32 +494,16 @@ class SecureStorageService:
                     "retention_days": self.retention_days,
                 }
             else:
-                # Get global stats - aggregate all users
-                clips_count = session.query(Clip).count()
-                edits_count = session.query(Edit).count()
-                snapshots_count = session.query(Snapshot).count()
-
-                # Get sizes
-                clips_size = (
-                    session.query(func.sum(Clip.file_size))
-                    .filter(Clip.file_size.isnot(None))
-                    .scalar()
-                    or 0
-                )
-
-                edits_size = (
-                    session.query(func.sum(Edit.file_size))
-                    .filter(Edit.file_size.isnot(None))
-                    .scalar()
-                    or 0
-                )
-
-                snapshots_size = (
-                    session.query(func.sum(Snapshot.file_size))
-                    .filter(Snapshot.file_size.isnot(None))
-                    .scalar()
-                    or 0
-                )
+                # Get global stats - one count + size aggregate per table
+                clips_count, clips_size = session.query(
+                    func.count(Clip.id), func.coalesce(func.sum(Clip.file_size), 0)
+                ).one()
+                edits_count, edits_size = session.query(
+                    func.count(Edit.id), func.coalesce(func.sum(Edit.file_size), 0)
+                ).one()
+                snapshots_count, snapshots_size = session.query(
+                    func.count(Snapshot.id), func.coalesce(func.sum(Snapshot.file_size), 0)
+                ).one()
 
                 total_size = clips_size + edits_size + snapshots_size
 
@@ -468,6 +528,17 @@ class SecureStorageService:
 
             return stats
 
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        """Remove a stored file, logging rather than raising on failure"""
+        try:
+            os.remove(file_path)
+            logger.info(f"Deleted file: {file_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error deleting file {file_path}: {e}")
+
     async def cleanup_old_files(self, user_id: Optional[str] = None) -> Dict[str, int]:
         """
         Clean up files older than retention period.
@@ -500,52 +571,36 @@ class SecureStorageService:
                     snapshots_query = snapshots_query.filter(Snapshot.user_id == user_id)
                     edits_query = edits_query.filter(Edit.user_id == user_id)
 
-                # Delete old clips
-                old_clips = clips_query.all()
-                for clip in old_clips:
-                    try:
-                        if clip.file_path and os.path.exists(clip.file_path):
-                            os.remove(clip.file_path)
-                            logger.info(f"Deleted clip file: {clip.file_path}")
-                    except Exception as e:
-                        logger.error(f"Error deleting clip file {clip.file_path}: {e}")
-
-                    session.delete(clip)
-                    clips_deleted += 1
-
-                # Delete old snapshots
-                old_snapshots = snapshots_query.all()
-                for snapshot in old_snapshots:
-                    try:
-                        if snapshot.file_path and os.path.exists(snapshot.file_path):
-                            os.remove(snapshot.file_path)
-                            logger.info(f"Deleted snapshot file: {snapshot.file_path}")
-                    except Exception as e:
-                        logger.error(f"Error deleting snapshot file {snapshot.file_path}: {e}")
-
-                    session.delete(snapshot)
-                    snapshots_deleted += 1
-
-                # Delete old edits
-                old_edits = edits_query.all()
-                for edit in old_edits:
-                    try:
-                        if edit.file_path and os.path.exists(edit.file_path):
-                            os.remove(edit.file_path)
-                            logger.info(f"Deleted edit file: {edit.file_path}")
-                    except Exception as e:
-                        logger.error(f"Error deleting edit file {edit.file_path}: {e}")
-
-                    session.delete(edit)
-                    edits_deleted += 1
+                # Collect file paths first, then remove rows with one DELETE per table.
+                # Edits go before their source clips; the edits.source_clip_id FK cascades
+                # any newer edits of a deleted clip, as the ORM cascade did.
+                file_paths = [
+                    path
+                    for query, column in (
+                        (edits_query, Edit.file_path),
+                        (snapshots_query, Snapshot.file_path),
+                        (clips_query, Clip.file_path),
+                    )
+                    for (path,) in query.with_entities(column)
+                    if path
+                ]
+
+                edits_deleted = edits_query.delete(synchronize_session=False)
+                snapshots_deleted = snapshots_query.delete(synchronize_session=False)
+                clips_deleted = clips_query.delete(synchronize_session=False)
 
                 # Commit all deletions
                 session.commit()
 
-                logger.info(
-                    f"Cleanup completed: deleted {clips_deleted} clips, "
-                    f"{snapshots_deleted} snapshots, {edits_deleted} edits"
-                )
+            # Unlink the files concurrently once the rows are gone
+            await asyncio.gather(
+                *(asyncio.to_thread(self._remove_file, path) for path in file_paths)
+            )
+
+            logger.info(
+                f"Cleanup completed: deleted {clips_deleted} clips, "
+                f"{snapshots_deleted} snapshots, {edits_deleted} edits"
+            )
 
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -4,10 +4,18 @@ Handles long-running video processing tasks to prevent request timeouts
 """
 
 import asyncio
-import uuid
+import functools
+import os
+import pickle  # nosec B403 - only loads files this process wrote itself
+import secrets
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 from core.logging import get_logger
 
@@ -23,126 +31,398 @@ class TaskStatus(str, Enum):
     FAILED = "failed"
 
 
+_FINISHED = frozenset((TaskStatus.COMPLETED, TaskStatus.FAILED))
+
+# Maps monotonic timestamps onto wall-clock time when a datetime is actually requested
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _to_datetime(monotonic_ns: int) -> datetime:
+    """Convert a time.monotonic_ns() timestamp to a local datetime"""
+    return datetime.fromtimestamp((monotonic_ns + _WALL_OFFSET_NS) / 1e9)
+
+
+def _result_size(value: Any) -> int:
+    """Approximate the bytes a task result holds, following the containers it is built from"""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_result_size(key) + _result_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(_result_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _SpilledResult:
+    """A task result pickled to a temporary file to keep large outputs off the heap"""
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    @classmethod
+    def dump(cls, result: Any) -> "_SpilledResult":
+        """Pickle result to a new temporary file"""
+        with tempfile.NamedTemporaryFile(
+            prefix="clipforge_task_", suffix=".pkl", delete=False
+        ) as handle:
+            try:
+                pickle.dump(result, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                handle.close()
+                os.unlink(handle.name)
+                raise
+        return cls(handle.name)
+
+    def load(self) -> Any:
+        """Read the result back and remove its file (blocking, so run it off the loop)"""
+        with open(self.path, "rb") as handle:
+            result = pickle.load(handle)  # nosec B301 - file written by _SpilledResult.dump
+        self.discard()
+        return result
+
+    def discard(self) -> None:
+        """Remove the spill file, if it still exists"""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
 class TaskResult:
     """Represents a task execution result"""
 
+    __slots__ = (
+        "task_id",
+        "status",
+        "result",
+        "error",
+        "created_ns",
+        "completed_ns",
+        "_worker",
+        "_done",
+    )
+
     def __init__(
         self,
         task_id: str,
         status: TaskStatus,
         result: Any = None,
         error: Optional[str] = None,
-        created_at: Optional[datetime] = None,
-        completed_at: Optional[datetime] = None,
+        created_ns: Optional[int] = None,
+        completed_ns: Optional[int] = None,
     ):
         self.task_id = task_id
         self.status = status
         self.result = result
         self.error = error
-        self.created_at = created_at or datetime.now()
-        self.completed_at = completed_at
+        # time.monotonic_ns() values; datetimes are only built for callers that ask
+        self.created_ns = created_ns or time.monotonic_ns()
+        self.completed_ns = completed_ns
+        # Worker running this task, set only while it runs so cleanup_task can cancel it
+        self._worker: Optional[asyncio.Task] = None
+        # Set once the task is finished or dropped, so waiters need not poll
+        self._done = asyncio.Event()
+
+    @property
+    def created_at(self) -> datetime:
+        """When the task was submitted"""
+        return _to_datetime(self.created_ns)
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """When the task finished, if it has"""
+        return _to_datetime(self.completed_ns) if self.completed_ns is not None else None
 
 
 class AsyncTaskQueue:
     """Simple async task queue for background processing"""
 
-    def __init__(self) -> None:
-        self._tasks: Dict[str, TaskResult] = {}
-        self._running_tasks: Dict[str, asyncio.Task] = {}
+    def __init__(
+        self,
+        max_completed: int = 1024,
+        result_ttl: float = 300.0,
+        concurrency: int = 4,
+        max_queued: int = 256,
+        executor: Optional[ThreadPoolExecutor] = None,
+        result_max_bytes: Optional[int] = None,
+        result_size: Callable[[Any], int] = _result_size,
+    ) -> None:
+        # Oldest / least recently read first, so eviction walks from the front
+        self._tasks: "OrderedDict[str, TaskResult]" = OrderedDict()
+        self._max_completed = max_completed
+        self._result_ttl = result_ttl
+        # Results that result_size measures above this are spilled to disk until read
+        self._result_max_bytes = result_max_bytes
+        self._result_size = result_size
+        self._busy = 0
         self.logger = get_logger("async_task_queue")
 
+        # A fixed pool of workers drains the queue; a full queue makes submit_task wait
+        self._concurrency = concurrency
+        self._queue: "asyncio.Queue[Tuple[str, Callable[..., Any], Any, Any]]" = asyncio.Queue(
+            maxsize=max_queued
+        )
+        self._workers: List[asyncio.Task] = []
+        self._closing = False
+
+        # Plain (non-async) task functions run here so CPU work never blocks the event loop
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="task_queue"
+        )
+
     async def submit_task(
         self,
-        task_func: Callable[..., Awaitable[Any]],
+        task_func: Callable[..., Any],
         *args: Any,
         task_id: Optional[str] = None,
         **kwargs: Any,
     ) -> str:
-        """Submit a task for background execution"""
+        """Submit a task for background execution
+
+        task_func may be a coroutine function or a plain callable; the latter runs on the
+        queue's thread pool.
+        """
 
         if task_id is None:
-            task_id = str(uuid.uuid4())
+            task_id = secrets.token_hex(16)
 
-        # Initialize task result
+        # Initialize task result; setdefault keeps a live task with the same id intact
         task_result = TaskResult(
-            task_id=task_id, status=TaskStatus.PENDING, created_at=datetime.now()
+            task_id=task_id, status=TaskStatus.PENDING, created_ns=time.monotonic_ns()
         )
-        self._tasks[task_id] = task_result
-
-        # Create and start the background task
-        async_task = asyncio.create_task(self._execute_task(task_id, task_func, *args, **kwargs))
-        self._running_tasks[task_id] = async_task
-
-        self.logger.info(f"Submitted task {task_id} for background execution")
+        existing = self._tasks.setdefault(task_id, task_result)
+        if existing is not task_result:
+            if existing.status not in _FINISHED:
+                raise ValueError(f"Task {task_id} is already queued or running")
+            self._tasks[task_id] = task_result
+
+        # Queue it for the worker pool, started on first use
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self._concurrency)]
+        try:
+            await self._queue.put((task_id, task_func, args, kwargs))
+        except BaseException:
+            # Never queued (e.g. cancelled while the queue was full), so don't track it
+            if self._tasks.get(task_id) is task_result:
+                del self._tasks[task_id]
+            raise
+
+        self.logger.info("Submitted task %s for background execution", task_id)
         return task_id
 
+    async def _worker(self) -> None:
+        """Run queued tasks one at a time until the queue is closed"""
+        worker = asyncio.current_task()
+        if worker is None:  # only ever started through asyncio.create_task
+            return
+
+        while True:
+            task_id, task_func, args, kwargs = await self._queue.get()
+            try:
+                await self._execute_task(task_id, task_func, *args, **kwargs)
+            except asyncio.CancelledError:
+                if self._closing:
+                    raise
+                # cleanup_task cancelled just this task; keep the worker going
+                worker.uncancel()
+            finally:
+                self._queue.task_done()
+
+    async def aclose(self) -> None:
+        """Stop the worker pool, failing any task still queued or running"""
+        self._closing = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+        # Nothing survives a restart, so leave no task stuck pending or processing
+        now_ns = time.monotonic_ns()
+        for task_result in self._tasks.values():
+            _discard_spill(task_result)
+            if task_result.status not in _FINISHED:
+                task_result.status = TaskStatus.FAILED
+                task_result.error = "Task interrupted by shutdown"
+                task_result.completed_ns = now_ns
+                task_result._done.set()
+
     async def _execute_task(
-        self, task_id: str, task_func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+        self, task_id: str, task_func: Callable[..., Any], *args: Any, **kwargs: Any
     ) -> None:
         """Execute a task in the background"""
+        task_result = self._tasks.get(task_id)
+        if task_result is None:
+            # Cleaned up while it was still queued
+            return
+
+        task_result._worker = asyncio.current_task()
+        self._busy += 1
 
         try:
             # Update status to processing
-            if task_id in self._tasks:
-                self._tasks[task_id].status = TaskStatus.PROCESSING
+            task_result.status = TaskStatus.PROCESSING
+
+            self.logger.info("Starting execution of task %s", task_id)
 
-            self.logger.info(f"Starting execution of task {task_id}")
+            # Execute the task function, off the event loop if it is synchronous
+            if asyncio.iscoroutinefunction(task_func):
+                result = await task_func(*args, **kwargs)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, functools.partial(task_func, *args, **kwargs)
+                )
 
-            # Execute the task function
-            result = await task_func(*args, **kwargs)
+            max_bytes = self._result_max_bytes
+            if max_bytes is not None and self._result_size(result) > max_bytes:
+                result = await self._spill(task_id, result)
 
             # Update with successful result
-            if task_id in self._tasks:
-                self._tasks[task_id].status = TaskStatus.COMPLETED
-                self._tasks[task_id].result = result
-                self._tasks[task_id].completed_at = datetime.now()
+            task_result.status = TaskStatus.COMPLETED
+            task_result.result = result
+            task_result.completed_ns = time.monotonic_ns()
 
-            self.logger.info(f"Task {task_id} completed successfully")
+            self.logger.info("Task %s completed successfully", task_id)
 
         except Exception as e:
             # Update with error
             error_msg = f"Task execution failed: {str(e)}"
-            self.logger.error(f"Task {task_id} failed: {error_msg}")
+            self.logger.error("Task %s failed: %s", task_id, error_msg)
 
-            if task_id in self._tasks:
-                self._tasks[task_id].status = TaskStatus.FAILED
-                self._tasks[task_id].error = error_msg
-                self._tasks[task_id].completed_at = datetime.now()
+            task_result.status = TaskStatus.FAILED
+            task_result.error = error_msg
+            task_result.completed_ns = time.monotonic_ns()
 
         finally:
             # Cleanup running task reference
-            if task_id in self._running_tasks:
-                del self._running_tasks[task_id]
+            task_result._worker = None
+            task_result._done.set()
+            self._busy -= 1
+            self._evict()
+
+    async def _spill(self, task_id: str, result: Any) -> Any:
+        """Move an oversized result to disk, keeping it in memory if it cannot be pickled"""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, _SpilledResult.dump, result
+            )
+        except (pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            self.logger.warning("Could not spill result of task %s to disk: %s", task_id, e)
+            return result
+
+    async def _restore(self, task: TaskResult) -> None:
+        """Load a spilled result back into its task, failing the task if the file is gone"""
+        spilled = task.result
+        if not isinstance(spilled, _SpilledResult):
+            return
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, spilled.load)
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            # Another reader may have restored it in the meantime
+            if task.result is spilled:
+                self.logger.error("Could not restore result of task %s: %s", task.task_id, e)
+                task.status = TaskStatus.FAILED
+                task.error = f"Task result could not be restored: {e}"
+                task.result = None
+            return
+
+        if task.result is spilled:
+            task.result = result
+
+    def _evict(self) -> None:
+        """Drop finished tasks past their TTL, then the least recently used over the cap"""
+        now_ns = time.monotonic_ns()
+        ttl_ns = self._result_ttl * 1e9
+        finished = [
+            (task_id, task) for task_id, task in self._tasks.items() if task.status in _FINISHED
+        ]
+        excess = len(finished) - self._max_completed
+
+        for task_id, task in finished:
+            completed_ns = task.completed_ns
+            expired = completed_ns is not None and now_ns - completed_ns > ttl_ns
+            if excess > 0 or expired:
+                del self._tasks[task_id]
+                _discard_spill(task)
+                excess -= 1
 
     def get_task_status(self, task_id: str) -> Optional[TaskResult]:
-        """Get current status of a task"""
-        return self._tasks.get(task_id)
+        """Get current status of a task
+
+        Never touches disk: a result spilled to disk stays there until it is read through
+        wait() or pop_result().
+        """
+        task = self._tasks.get(task_id)
+        if task is not None:
+            self._tasks.move_to_end(task_id)
+        return task
+
+    async def pop_result(self, task_id: str) -> Any:
+        """Return a finished task's result and drop it, keeping only the status metadata
+
+        Clients should call this once they have fetched the result so large outputs are not
+        held until the task is evicted. Returns None if the task is unknown or unfinished.
+        """
+        task = self._tasks.get(task_id)
+        if task is None or task.status not in _FINISHED:
+            return None
+        await self._restore(task)
+        result, task.result = task.result, None
+        return result
+
+    async def wait(self, task_id: str, timeout: Optional[float] = None) -> Optional[TaskResult]:
+        """Wait until a task finishes and return it, or None if it is not tracked
+
+        Raises TimeoutError if the task is still running after timeout seconds.
+        """
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        await asyncio.wait_for(task._done.wait(), timeout)
+        await self._restore(task)
+        return task
 
     def is_task_complete(self, task_id: str) -> bool:
         """Check if a task is complete (either success or failure)"""
         task = self._tasks.get(task_id)
         if not task:
             return False
-        return task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]
+        return task.status in _FINISHED
 
     def cleanup_task(self, task_id: str) -> None:
         """Remove task from memory (call after client retrieves result)"""
-        if task_id in self._tasks:
-            del self._tasks[task_id]
-        if task_id in self._running_tasks:
+        task_result = self._tasks.pop(task_id, None)
+        if task_result is None:
+            return
+        if task_result._worker is not None:
             # Cancel if still running
-            self._running_tasks[task_id].cancel()
-            del self._running_tasks[task_id]
+            task_result._worker.cancel()
+        _discard_spill(task_result)
+        task_result._done.set()
 
     def get_active_task_count(self) -> int:
-        """Get number of currently active tasks"""
-        return len(self._running_tasks)
+        """Get number of currently active tasks (running or waiting for a worker)"""
+        return self._busy + self._queue.qsize()
 
     def get_total_task_count(self) -> int:
         """Get total number of tracked tasks"""
         return len(self._tasks)
 
 
+def _discard_spill(task: TaskResult) -> None:
+    """Delete a spilled result's file when its task is dropped"""
+    if isinstance(task.result, _SpilledResult):
+        task.result.discard()
+        task.result = None
+
+
 # Global task queue instance
 task_queue = AsyncTaskQueue()
 